@@ -47,6 +47,8 @@ class Settings(BaseSettings):
     # Event Configuration
     event_ttl_days: int = 30
     deduplication_window_seconds: int = 300
+    deduplication_max_entries: int = 10_000
+    deduplication_admission_filter: bool = False
 
     # API Limits
     max_request_size_bytes: int = 512 * 1024  # 512KB
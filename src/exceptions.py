@@ -162,6 +162,28 @@ class ServiceUnavailableError(TriggerAPIError):
         )
 
 
+class BatchWriteError(ServiceUnavailableError):
+    """Raised when a batch write leaves items unwritten (503)."""
+
+    def __init__(
+        self,
+        unprocessed_items: list[dict[str, Any]],
+        message: str = "DynamoDB batch write left unprocessed items",
+        service: str | None = "DynamoDB",
+    ) -> None:
+        """
+        Initialize BatchWriteError.
+
+        Args:
+            unprocessed_items: Items that were not written; every other
+                item in the batch was stored
+            message: Error message
+            service: Name of the unavailable service
+        """
+        super().__init__(message=message, service=service)
+        self.unprocessed_items = unprocessed_items
+
+
 class RequestTooLargeError(TriggerAPIError):
     """Raised when request payload exceeds size limit (413)."""
 
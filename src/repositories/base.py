@@ -1,11 +1,16 @@
 """Base repository class with common DynamoDB operations."""
 
+import asyncio
 from typing import Any
 
 import aioboto3
 from botocore.exceptions import ClientError
 
 from src.config import settings
+from src.exceptions import BatchWriteError
+
+# DynamoDB BatchWriteItem accepts at most 25 put/delete requests per call
+BATCH_WRITE_LIMIT = 25
 
 
 def get_dynamodb_config() -> dict[str, Any]:
@@ -94,6 +99,76 @@ class BaseRepository:
             table = await dynamodb.Table(self.table_name)
             await table.put_item(Item=item)
 
+    async def batch_put_items(
+        self,
+        items: list[dict[str, Any]],
+        max_retries: int = 5,
+        base_delay: float = 0.05,
+    ) -> None:
+        """
+        Put many items using BatchWriteItem, 25 items per request.
+
+        UnprocessedItems returned by DynamoDB (throttling) are resubmitted
+        with exponential backoff. Chunks are written in order, so on failure
+        every item before the failing chunk has been stored.
+
+        Args:
+            items: Item dictionaries to store
+            max_retries: Resubmissions allowed per chunk before giving up
+            base_delay: Initial backoff delay in seconds (doubles per retry)
+
+        Raises:
+            BatchWriteError: If items remain unprocessed after retries or a
+                chunk's request fails; carries exactly the unwritten items
+        """
+        if not items:
+            return
+
+        async with self.session.resource("dynamodb", **get_dynamodb_config()) as dynamodb:
+            for start in range(0, len(items), BATCH_WRITE_LIMIT):
+                request_items = {
+                    self.table_name: [
+                        {"PutRequest": {"Item": item}}
+                        for item in items[start : start + BATCH_WRITE_LIMIT]
+                    ]
+                }
+                remaining = items[start + BATCH_WRITE_LIMIT :]
+                for attempt in range(max_retries + 1):
+                    try:
+                        response = await dynamodb.batch_write_item(
+                            RequestItems=request_items
+                        )
+                    except ClientError as exc:
+                        raise BatchWriteError(
+                            self._pending_items(request_items) + remaining
+                        ) from exc
+                    request_items = response.get("UnprocessedItems") or {}
+                    if not request_items:
+                        break
+                    if attempt < max_retries:
+                        await asyncio.sleep(base_delay * 2**attempt)
+                else:
+                    raise BatchWriteError(
+                        self._pending_items(request_items) + remaining
+                    )
+
+    def _pending_items(
+        self, request_items: dict[str, list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """
+        Extract the items from a BatchWriteItem RequestItems mapping.
+
+        Args:
+            request_items: RequestItems or UnprocessedItems for this table
+
+        Returns:
+            Item dictionaries of the put requests
+        """
+        return [
+            request["PutRequest"]["Item"]
+            for request in request_items.get(self.table_name, [])
+        ]
+
     async def get_item(self, key: dict[str, Any]) -> dict[str, Any] | None:
         """
         Get item from DynamoDB table by key.
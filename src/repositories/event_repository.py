@@ -34,24 +34,52 @@ class EventRepository(BaseRepository):
             item["delivered"] = bool(item["delivered"])
         return Event(**item)
 
-    async def create(self, event: Event) -> Event:
+    def _serialize_event(self, event: Event) -> dict:
         """
-        Create a new event in DynamoDB.
+        Convert Event model to DynamoDB item.
 
         Args:
             event: Event model to store
 
         Returns:
-            The created Event
+            DynamoDB item dict
         """
         # Exclude None values as DynamoDB doesn't handle them
         item = event.model_dump(exclude_none=True)
         # Convert boolean delivered to int (0/1) for DynamoDB GSI
         if "delivered" in item:
             item["delivered"] = 1 if item["delivered"] else 0
-        await self.put_item(item)
+        return item
+
+    async def create(self, event: Event) -> Event:
+        """
+        Create a new event in DynamoDB.
+
+        Args:
+            event: Event model to store
+
+        Returns:
+            The created Event
+        """
+        await self.put_item(self._serialize_event(event))
         return event
 
+    async def batch_create(self, events: list[Event]) -> list[Event]:
+        """
+        Create many events using BatchWriteItem.
+
+        Args:
+            events: Event models to store
+
+        Returns:
+            The created Events
+
+        Raises:
+            BatchWriteError: If some events could not be written
+        """
+        await self.batch_put_items([self._serialize_event(event) for event in events])
+        return events
+
     async def get_by_id(self, event_id: str, timestamp: str) -> Event | None:
         """
         Get event by ID and timestamp.
@@ -95,7 +123,11 @@ class EventRepository(BaseRepository):
             }
 
             if last_evaluated_key:
-                query_params["ExclusiveStartKey"] = last_evaluated_key
+                # Cursors carry only the table keys; the index key is fixed
+                query_params["ExclusiveStartKey"] = {
+                    **last_evaluated_key,
+                    "delivered": 0,
+                }
 
             response = await table.query(**query_params)
 
@@ -6,16 +6,31 @@ from fastapi import APIRouter, Depends, Query, Request, status
 from src.auth.dependencies import require_api_key
 from src.middleware.rate_limit import rate_limiter
 from src.models.api_key import ApiKey
+from src.repositories.event_repository import EventRepository
 from src.schemas.event import (
     CreateEventRequest,
     EventResponse,
     InboxResponse,
 )
-from src.services.event_service import EventService
+from src.services.event_service import EventService, get_dedup_cache
+from src.utils.deduplication import DeduplicationCache
 
 router = APIRouter(tags=["Events"])
 
 
+def get_event_repository() -> EventRepository:
+    """
+    Provide the EventRepository used by event routes.
+
+    Declared as a dependency so tests can swap it out through
+    ``app.dependency_overrides``.
+
+    Returns:
+        EventRepository instance
+    """
+    return EventRepository()
+
+
 @router.post(
     "/events",
     response_model=EventResponse,
@@ -108,6 +123,8 @@ async def create_event(
     request: Request,
     event_request: CreateEventRequest,
     api_key: ApiKey = Depends(require_api_key),
+    repository: EventRepository = Depends(get_event_repository),
+    dedup_cache: DeduplicationCache = Depends(get_dedup_cache),
 ) -> EventResponse:
     """
     Ingest a new event into the system.
@@ -119,6 +136,8 @@ async def create_event(
         request: FastAPI request object
         event_request: Event data to ingest
         api_key: Authenticated API key (injected by dependency)
+        repository: Event repository (injected by dependency)
+        dedup_cache: Shared deduplication cache (injected by dependency)
 
     Returns:
         EventResponse with event ID, timestamp, and status
@@ -133,7 +152,7 @@ async def create_event(
     rate_limiter.check_rate_limit(api_key.key_id, api_key.rate_limit)
 
     # Create service and ingest event
-    service = EventService()
+    service = EventService(repository=repository, dedup_cache=dedup_cache)
     response = await service.ingest(event_request)
 
     return response
@@ -224,6 +243,8 @@ async def get_inbox(
         description="Pagination cursor from previous response",
     ),
     api_key: ApiKey = Depends(require_api_key),
+    repository: EventRepository = Depends(get_event_repository),
+    dedup_cache: DeduplicationCache = Depends(get_dedup_cache),
 ) -> InboxResponse:
     """
     List undelivered events with pagination.
@@ -236,6 +257,8 @@ async def get_inbox(
         limit: Maximum events to return (default 50, max 200)
         cursor: Opaque pagination cursor (None for first page)
         api_key: Authenticated API key (injected by dependency)
+        repository: Event repository (injected by dependency)
+        dedup_cache: Shared deduplication cache (injected by dependency)
 
     Returns:
         InboxResponse with list of events and pagination metadata
@@ -248,7 +271,7 @@ async def get_inbox(
     rate_limiter.check_rate_limit(api_key.key_id, api_key.rate_limit)
 
     # Create service and list inbox
-    service = EventService()
+    service = EventService(repository=repository, dedup_cache=dedup_cache)
     response = await service.list_inbox(limit=limit, cursor=cursor)
 
     return response
@@ -301,6 +324,8 @@ async def get_event(
         default=None,
         description="Optional ISO 8601 timestamp for composite key lookup",
     ),
+    repository: EventRepository = Depends(get_event_repository),
+    dedup_cache: DeduplicationCache = Depends(get_dedup_cache),
 ) -> EventResponse:
     """
     Retrieve a specific event by ID.
@@ -309,6 +334,8 @@ async def get_event(
         event_id: Event UUID
         api_key: Authenticated API key (injected by dependency)
         timestamp: Optional ISO 8601 timestamp (for composite key support)
+        repository: Event repository (injected by dependency)
+        dedup_cache: Shared deduplication cache (injected by dependency)
 
     Returns:
         EventResponse with full event details
@@ -319,7 +346,7 @@ async def get_event(
     """
     from src.exceptions import EventNotFoundError
 
-    service = EventService()
+    service = EventService(repository=repository, dedup_cache=dedup_cache)
     response = await service.get(event_id, timestamp) if timestamp else await service.get_by_id(event_id)
 
     if response is None:
@@ -353,6 +380,8 @@ async def delete_event(
         default=None,
         description="Optional ISO 8601 timestamp for composite key lookup",
     ),
+    repository: EventRepository = Depends(get_event_repository),
+    dedup_cache: DeduplicationCache = Depends(get_dedup_cache),
 ) -> None:
     """
     Mark an event as delivered (soft delete).
@@ -364,6 +393,8 @@ async def delete_event(
         event_id: Event UUID
         api_key: Authenticated API key (injected by dependency)
         timestamp: Optional ISO 8601 timestamp (for composite key support)
+        repository: Event repository (injected by dependency)
+        dedup_cache: Shared deduplication cache (injected by dependency)
 
     Returns:
         None (204 No Content)
@@ -374,7 +405,7 @@ async def delete_event(
     """
     from src.exceptions import EventNotFoundError
 
-    service = EventService()
+    service = EventService(repository=repository, dedup_cache=dedup_cache)
     result = await service.mark_delivered(event_id, timestamp) if timestamp else await service.mark_delivered_by_id(event_id)
 
     if not result:
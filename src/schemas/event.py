@@ -1,8 +1,18 @@
 """Pydantic schemas for event API requests and responses."""
 
+from collections.abc import Mapping
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    ValidationError,
+    model_validator,
+)
+from pydantic_core import InitErrorDetails, PydanticCustomError
+
+from src.utils.serialization import encode_payload, has_non_finite_number
 
 
 class CreateEventRequest(BaseModel):
@@ -14,6 +24,10 @@ class CreateEventRequest(BaseModel):
         payload: Arbitrary JSON data (required, max 256KB)
         source: Optional source identifier
         metadata: Optional additional metadata
+
+    The model is frozen because the canonical payload encoding is cached
+    at validation time; the payload dict itself must not be mutated
+    after construction.
     """
 
     event_type: str = Field(
@@ -26,37 +40,82 @@ class CreateEventRequest(BaseModel):
     source: str | None = Field(None, description="Event source")
     metadata: dict[str, Any] | None = Field(None, description="Additional metadata")
 
-    @field_validator("payload")
-    @classmethod
-    def validate_payload_size(cls, v: dict[str, Any]) -> dict[str, Any]:
+    _encoded_payload: bytes | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def validate_payload(self) -> "CreateEventRequest":
         """
-        Validate payload size is under 256KB.
+        Validate payload size is under 256KB and all numbers are finite.
 
-        Args:
-            v: Payload dictionary
+        Size is measured on the compact UTF-8 canonical encoding (no
+        whitespace, non-ASCII characters counted at their UTF-8 length
+        rather than as \\uXXXX escapes), which is the form hashed for
+        deduplication and close to what DynamoDB stores. The encoding is
+        cached on the model so deduplication can reuse it instead of
+        re-serializing.
 
         Returns:
-            Validated payload
+            Validated request
 
         Raises:
-            ValueError: If payload exceeds 256KB
+            ValidationError: If payload exceeds 256KB or contains NaN/Infinity
         """
-        import json
-
-        payload_size = len(json.dumps(v).encode("utf-8"))
+        encoded = encode_payload(self.payload)
+        payload_size = len(encoded)
         max_size = 256 * 1024  # 256KB
 
+        error: PydanticCustomError | None = None
         if payload_size > max_size:
-            raise ValueError(
-                f"Payload size ({payload_size} bytes) "
-                f"exceeds maximum of {max_size} bytes"
+            error = PydanticCustomError(
+                "value_error",
+                "Payload size ({size} bytes) exceeds maximum of {max_size} bytes",
+                {"size": payload_size, "max_size": max_size},
             )
+        elif has_non_finite_number(self.payload, encoded):
+            # JSON has no NaN/Infinity; orjson would encode them as null
+            error = PydanticCustomError(
+                "value_error", "Payload must not contain NaN or Infinity"
+            )
+
+        if error is not None:
+            raise ValidationError.from_exception_data(
+                type(self).__name__,
+                [InitErrorDetails(type=error, loc=("payload",), input=self.payload)],
+            )
+
+        self._encoded_payload = encoded
+        return self
 
-        return v
+    @property
+    def encoded_payload(self) -> bytes:
+        """Canonical payload bytes (see src.utils.serialization.encode_payload)."""
+        if self._encoded_payload is None:
+            self._encoded_payload = encode_payload(self.payload)
+        return self._encoded_payload
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "CreateEventRequest":
+        """
+        Copy the request, dropping the cached encoding if payload changes.
+
+        Args:
+            update: Field values to replace in the copy
+            deep: Whether to deep-copy field values
+
+        Returns:
+            Copied request
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "payload" in update:
+            copied._encoded_payload = None
+        return copied
 
     class Config:
         """Pydantic configuration."""
 
+        frozen = True
+
         json_schema_extra = {
             "example": {
                 "event_type": "user.signup",
@@ -1,11 +1,14 @@
 """Event service layer with business logic for event operations."""
 
-import json
+import asyncio
 import uuid
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
-from decimal import Decimal
+from functools import lru_cache
+from typing import Any
 
 from src.config import settings
+from src.exceptions import BatchWriteError
 from src.models.event import Event
 from src.repositories.event_repository import EventRepository
 from src.schemas.event import (
@@ -15,25 +18,28 @@ from src.schemas.event import (
     InboxResponse,
     PaginationMetadata,
 )
+from src.utils.cursor import decode_cursor, encode_cursor
 from src.utils.deduplication import DeduplicationCache
 
 
-def decimal_to_number(obj):
+@lru_cache(maxsize=1)
+def get_dedup_cache() -> DeduplicationCache:
     """
-    Convert Decimal to int or float for JSON serialization.
+    Provide the process-wide deduplication cache.
 
-    DynamoDB returns numeric values as Decimal objects which are not
-    JSON serializable by default.
-
-    Args:
-        obj: Object to convert (if Decimal)
+    Built once from settings and shared by every EventService, so the
+    dedup window and size bound apply across requests. Declared as a
+    route dependency so tests can swap it out through
+    ``app.dependency_overrides``.
 
     Returns:
-        int or float if obj is Decimal, raises TypeError otherwise
+        Shared DeduplicationCache instance
     """
-    if isinstance(obj, Decimal):
-        return int(obj) if obj % 1 == 0 else float(obj)
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+    return DeduplicationCache(
+        window_seconds=settings.deduplication_window_seconds,
+        max_size=settings.deduplication_max_entries,
+        admission_filter=settings.deduplication_admission_filter,
+    )
 
 
 class EventService:
@@ -48,18 +54,22 @@ class EventService:
         self,
         repository: EventRepository | None = None,
         dedup_cache: DeduplicationCache | None = None,
+        id_factory: Callable[[], Any] = uuid.uuid4,
+        clock: Callable[[], datetime] = datetime.utcnow,
     ) -> None:
         """
         Initialize EventService.
 
         Args:
             repository: EventRepository instance (creates new if None)
-            dedup_cache: DeduplicationCache instance (creates new if None)
+            dedup_cache: DeduplicationCache instance (shared cache if None)
+            id_factory: Callable producing new event IDs (default: uuid4)
+            clock: Callable returning the current UTC datetime
         """
-        self.repository = repository or EventRepository()
-        self.dedup_cache = dedup_cache or DeduplicationCache(
-            window_seconds=settings.deduplication_window_seconds
-        )
+        self.repository = repository if repository is not None else EventRepository()
+        self.dedup_cache = dedup_cache if dedup_cache is not None else get_dedup_cache()
+        self.id_factory = id_factory
+        self.clock = clock
 
     async def ingest(self, request: CreateEventRequest) -> EventResponse:
         """
@@ -75,12 +85,12 @@ class EventService:
             EventResponse with event ID and status
         """
         # Generate event ID and timestamp
-        event_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        event_id = str(self.id_factory())
+        timestamp = self.clock().isoformat() + "Z"
 
         # Check for duplicates
-        existing_id = self.dedup_cache.check_and_add(
-            request.event_type, request.payload, event_id
+        existing_id = self.dedup_cache.check_and_add_encoded(
+            request.event_type, request.encoded_payload, event_id
         )
 
         if existing_id:
@@ -105,8 +115,15 @@ class EventService:
             updated_at=timestamp,
         )
 
-        # Persist to DynamoDB
-        await self.repository.create(event)
+        # Persist to DynamoDB; forget the fingerprint if the write fails so
+        # a client retry is not answered with an ID that was never stored
+        try:
+            await self.repository.create(event)
+        except Exception:
+            self.dedup_cache.discard_batch(
+                [(request.event_type, request.encoded_payload)], [event_id]
+            )
+            raise
 
         return EventResponse(
             status="accepted",
@@ -119,6 +136,97 @@ class EventService:
             delivered=event.delivered,
         )
 
+    async def ingest_many(
+        self, requests: list[CreateEventRequest]
+    ) -> list[EventResponse]:
+        """
+        Ingest a batch of events.
+
+        Deduplicates the whole batch in one pass (duplicates within the
+        batch collapse onto the first occurrence) and persists the new
+        events with batched DynamoDB writes. If the write fails, the
+        fingerprints of events that were not stored are removed from the
+        dedup cache again.
+
+        Args:
+            requests: CreateEventRequests with event data
+
+        Returns:
+            EventResponses in the same order as requests
+        """
+        timestamp = self.clock().isoformat() + "Z"
+        event_ids = [str(self.id_factory()) for _ in requests]
+        keys = [(request.event_type, request.encoded_payload) for request in requests]
+
+        existing_ids = self.dedup_cache.check_and_add_batch(keys, event_ids)
+
+        responses: list[EventResponse] = []
+        new_events: list[Event] = []
+        new_keys: list[tuple[str, bytes]] = []
+        for request, key, event_id, existing_id in zip(
+            requests, keys, event_ids, existing_ids, strict=True
+        ):
+            if existing_id:
+                responses.append(
+                    EventResponse(
+                        status="accepted",
+                        event_id=existing_id,
+                        timestamp=timestamp,
+                        message="Event successfully ingested (duplicate detected)",
+                    )
+                )
+                continue
+
+            event = Event(
+                event_id=event_id,
+                timestamp=timestamp,
+                event_type=request.event_type,
+                payload=request.payload,
+                source=request.source,
+                metadata=request.metadata,
+                delivered=False,
+                created_at=timestamp,
+                updated_at=timestamp,
+            )
+            new_events.append(event)
+            new_keys.append(key)
+            responses.append(
+                EventResponse(
+                    status="accepted",
+                    event_id=event_id,
+                    timestamp=timestamp,
+                    message="Event successfully ingested",
+                    event_type=event.event_type,
+                    payload=event.payload,
+                    source=event.source,
+                    delivered=event.delivered,
+                )
+            )
+
+        if new_events:
+            try:
+                await self.repository.batch_create(new_events)
+            except BatchWriteError as exc:
+                # Earlier chunks were stored; only forget the unwritten events
+                unwritten = {item["event_id"] for item in exc.unprocessed_items}
+                failed = [
+                    (key, event.event_id)
+                    for key, event in zip(new_keys, new_events, strict=True)
+                    if event.event_id in unwritten
+                ]
+                self.dedup_cache.discard_batch(
+                    [key for key, _ in failed], [event_id for _, event_id in failed]
+                )
+                raise
+            except Exception:
+                # Unknown outcome: a duplicate write beats a lost event
+                self.dedup_cache.discard_batch(
+                    new_keys, [event.event_id for event in new_events]
+                )
+                raise
+
+        return responses
+
     async def get(self, event_id: str, timestamp: str) -> EventResponse | None:
         """
         Get a specific event by ID and timestamp.
@@ -162,16 +270,8 @@ class EventService:
         # Validate and clamp limit
         limit = min(max(1, limit), settings.max_inbox_limit)
 
-        # Decode cursor (simplified - in production use base64)
-        last_evaluated_key = None
-        if cursor:
-            # For MVP, cursor is just the last_evaluated_key dict
-            # In production, would base64 encode/decode
-            try:
-                last_evaluated_key = json.loads(cursor)
-            except Exception:
-                # Invalid cursor, start from beginning
-                last_evaluated_key = None
+        # Decode cursor (invalid cursor starts from beginning)
+        last_evaluated_key = decode_cursor(cursor) if cursor else None
 
         # Query undelivered events
         events, next_key = await self.repository.list_undelivered(
@@ -190,10 +290,8 @@ class EventService:
             for event in events
         ]
 
-        # Encode next cursor (with Decimal handling for DynamoDB)
-        next_cursor = None
-        if next_key:
-            next_cursor = json.dumps(next_key, default=decimal_to_number)
+        # Encode next cursor
+        next_cursor = encode_cursor(next_key) if next_key else None
 
         # Get total count (simplified - just check if more results)
         # In production, might query GSI for count or cache this value
@@ -210,6 +308,49 @@ class EventService:
 
         return InboxResponse(events=event_items, pagination=pagination)
 
+    async def iter_inbox(self, page_size: int = 50) -> AsyncIterator[Event]:
+        """
+        Iterate over all undelivered events, prefetching the next page.
+
+        While the caller consumes one page, the query for the following
+        page is already in flight, so a multi-page scan waits on roughly
+        one round trip instead of one per page.
+
+        Callers that may stop early should iterate inside
+        ``contextlib.aclosing`` so the in-flight query is cancelled as soon
+        as they leave the loop rather than when the generator is garbage
+        collected::
+
+            async with aclosing(service.iter_inbox()) as events:
+                async for event in events:
+                    ...
+
+        Args:
+            page_size: Events per repository query (clamped like list_inbox)
+
+        Yields:
+            Undelivered events in chronological order
+        """
+        page_size = min(max(1, page_size), settings.max_inbox_limit)
+        next_page: asyncio.Task | None = asyncio.create_task(
+            self.repository.list_undelivered(limit=page_size, last_evaluated_key=None)
+        )
+        try:
+            while next_page is not None:
+                events, next_key = await next_page
+                next_page = None
+                if next_key:
+                    next_page = asyncio.create_task(
+                        self.repository.list_undelivered(
+                            limit=page_size, last_evaluated_key=next_key
+                        )
+                    )
+                for event in events:
+                    yield event
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
     async def mark_delivered(self, event_id: str, timestamp: str) -> bool:
         """
         Mark an event as delivered.
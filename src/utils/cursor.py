@@ -0,0 +1,72 @@
+"""
+Opaque pagination cursors for the inbox.
+
+A cursor is the unpadded URL-safe base64 encoding of
+``event_id\\x00timestamp``, the two key attributes needed to resume a
+DeliveredIndex query. Padding is dropped so cursors need no escaping in
+query strings; padded cursors are still accepted.
+"""
+
+import base64
+import binascii
+from functools import lru_cache
+
+_SEPARATOR = "\x00"
+
+
+def encode_cursor(key: dict) -> str:
+    """
+    Encode a DynamoDB LastEvaluatedKey as an opaque cursor.
+
+    Args:
+        key: LastEvaluatedKey containing event_id and timestamp
+
+    Returns:
+        Unpadded URL-safe base64 cursor string
+    """
+    raw = f"{key['event_id']}{_SEPARATOR}{key['timestamp']}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict | None:
+    """
+    Decode an opaque cursor back into a pagination key.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor()
+
+    Returns:
+        Dict with event_id and timestamp, or None if the cursor is invalid
+    """
+    key = _decode_key(cursor)
+    if key is None:
+        return None
+    event_id, timestamp = key
+    return {"event_id": event_id, "timestamp": timestamp}
+
+
+# Clients retrying or re-polling a page send the same cursor repeatedly;
+# results are immutable tuples so callers always get a fresh dict
+@lru_cache(maxsize=1024)
+def _decode_key(cursor: str) -> tuple[str, str] | None:
+    """
+    Decode a cursor into its (event_id, timestamp) pair.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor()
+
+    Returns:
+        (event_id, timestamp), or None if the cursor is invalid
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.b64decode(cursor + padding, altchars=b"-_", validate=True).decode(
+            "utf-8"
+        )
+    except (binascii.Error, ValueError):
+        return None
+
+    event_id, separator, timestamp = raw.partition(_SEPARATOR)
+    if not separator or not timestamp:
+        return None
+    return event_id, timestamp
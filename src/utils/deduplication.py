@@ -1,13 +1,136 @@
 """
 Deduplication cache for detecting duplicate events.
 
-Uses in-memory storage with TTL-based expiration.
+Uses bounded in-memory storage with TTL-based expiration and FIFO eviction.
 Suitable for single-instance deployments or MVP.
 """
 
 import hashlib
-import json
+import sys
 import time
+from array import array
+from collections import deque
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Protocol
+
+import blake3
+import orjson
+
+from src.utils.serialization import encode_payload
+
+
+class _Hasher(Protocol):
+    """Incremental hash object shared by blake3 and hashlib."""
+
+    def update(self, data: bytes, /) -> object:
+        """Feed more bytes into the hash."""
+
+    def digest(self) -> bytes:
+        """Return the raw digest of the bytes fed so far."""
+
+
+# Fingerprint hash constructors; dedup needs speed, not collision resistance
+# against adversaries, so BLAKE3 is the default
+HASH_ALGORITHMS: dict[str, Callable[[bytes], _Hasher]] = {
+    "blake3": blake3.blake3,
+    "sha256": hashlib.sha256,
+}
+
+
+# Fingerprints are truncated to 128 bits: ample for a collision-free window
+# of unique events, and half the key size of a full 32-byte digest
+FINGERPRINT_BYTES = 16
+
+# Payloads up to this size have their fingerprints memoized; larger ones are
+# hashed directly so the memo never pins big buffers in memory
+FINGERPRINT_MEMO_MAX_BYTES = 1024
+
+
+def _hash_event(hash_algo: str, event_type: str, encoded_payload: bytes) -> bytes:
+    """
+    Hash an event type and canonical payload bytes.
+
+    Args:
+        hash_algo: Key into HASH_ALGORITHMS
+        event_type: Event type string
+        encoded_payload: Payload bytes from encode_payload()
+
+    Returns:
+        Raw digest of event content, FINGERPRINT_BYTES long
+    """
+    hasher = HASH_ALGORITHMS[hash_algo](orjson.dumps(event_type))
+    hasher.update(encoded_payload)
+    return hasher.digest()[:FINGERPRINT_BYTES]
+
+
+# Repeated submissions of the same small event skip re-hashing
+_hash_event_cached = lru_cache(maxsize=2048)(_hash_event)
+
+
+class _CountMinSketch:
+    """
+    Approximate frequency counter for fingerprints.
+
+    Each row is indexed by a different 4-byte slice of the fingerprint
+    digest, which is already uniformly distributed, so no extra hashing is
+    needed. Counters are halved every ``10 * width`` increments so old
+    traffic ages out.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 4) -> None:
+        """
+        Initialize sketch.
+
+        Args:
+            width: Counters per row
+            depth: Number of rows (each uses 4 bytes of the digest)
+
+        Raises:
+            ValueError: If the fingerprint is too short to index every row
+        """
+        if 4 * depth > FINGERPRINT_BYTES:
+            raise ValueError(
+                f"Sketch depth {depth} needs {4 * depth} fingerprint bytes, "
+                f"have {FINGERPRINT_BYTES}"
+            )
+        self.width = width
+        self.depth = depth
+        self._rows = [array("I", bytes(4 * width)) for _ in range(depth)]
+        self._increments = 0
+        self._sample_size = 10 * width
+
+    def increment(self, fingerprint: bytes) -> int:
+        """
+        Count one occurrence of a fingerprint.
+
+        Args:
+            fingerprint: Raw digest of at least 4 * depth bytes
+
+        Returns:
+            Estimated occurrences, including this one
+        """
+        estimate = sys.maxsize
+        for row_index, row in enumerate(self._rows):
+            offset = 4 * row_index
+            slot = (
+                int.from_bytes(fingerprint[offset : offset + 4], "little") % self.width
+            )
+            row[slot] += 1
+            estimate = min(estimate, row[slot])
+
+        self._increments += 1
+        if self._increments >= self._sample_size:
+            self._age()
+        return estimate
+
+    def _age(self) -> None:
+        """Halve every counter."""
+        for row in self._rows:
+            for slot, count in enumerate(row):
+                if count:
+                    row[slot] = count >> 1
+        self._increments = 0
 
 
 class DeduplicationCache:
@@ -15,20 +138,51 @@ class DeduplicationCache:
     In-memory cache for event deduplication.
 
     Tracks event fingerprints within a time window to detect duplicates.
-    Automatically cleans up expired entries on check operations.
+    A window of zero or less disables deduplication entirely.
+
+    Storage is split into a fingerprint -> event_id dict for lookups and an
+    insertion-ordered deque of (fingerprint, expiry) for cleanup. With a
+    fixed window, insertion order is expiry order, so cleanup only pops
+    from the deque head and the oldest entry is evicted at max_size.
+
+    With ``admission_filter`` enabled, a full cache only admits a new
+    fingerprint once it has been seen at least twice (TinyLFU-style), so a
+    flood of unique events cannot push out entries still inside the window.
     """
 
-    def __init__(self, window_seconds: int = 300) -> None:
+    def __init__(
+        self,
+        window_seconds: int = 300,
+        max_size: int = 10_000,
+        hash_algo: str = "blake3",
+        time_fn: Callable[[], float] = time.monotonic,
+        admission_filter: bool = False,
+    ) -> None:
         """
         Initialize deduplication cache.
 
         Args:
             window_seconds: Deduplication time window (default: 300 = 5min)
+            max_size: Maximum number of fingerprints retained (default: 10000)
+            hash_algo: Fingerprint hash, "blake3" (default) or "sha256"
+            time_fn: Monotonic clock in seconds (default: time.monotonic)
+            admission_filter: Gate inserts into a full cache on a
+                frequency sketch (default: False)
+
+        Raises:
+            ValueError: If hash_algo is not supported
         """
+        if hash_algo not in HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported hash_algo: {hash_algo}")
         self.window_seconds = window_seconds
-        self._cache: dict[str, tuple[str, float]] = {}
+        self.max_size = max_size
+        self.hash_algo = hash_algo
+        self._now = time_fn
+        self._ids: dict[bytes, str] = {}
+        self._expiries: deque[tuple[bytes, float]] = deque()
+        self._sketch = _CountMinSketch() if admission_filter else None
 
-    def _generate_fingerprint(self, event_type: str, payload: dict) -> str:
+    def _generate_fingerprint(self, event_type: str, payload: dict) -> bytes:
         """
         Generate unique fingerprint for event.
 
@@ -37,20 +191,36 @@ class DeduplicationCache:
             payload: Event payload dictionary
 
         Returns:
-            SHA256 hash of event content
+            Raw digest of event content (FINGERPRINT_BYTES long)
         """
-        content = json.dumps(
-            {"event_type": event_type, "payload": payload},
-            sort_keys=True,
-        )
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return self._fingerprint_encoded(event_type, encode_payload(payload))
+
+    def _fingerprint_encoded(self, event_type: str, encoded_payload: bytes) -> bytes:
+        """
+        Generate fingerprint from an already-encoded payload.
+
+        Args:
+            event_type: Event type string
+            encoded_payload: Payload bytes from encode_payload()
 
-    def _cleanup_expired(self) -> None:
-        """Remove expired entries from cache."""
-        now = time.time()
-        expired_keys = [key for key, (_, expiry) in self._cache.items() if expiry < now]
-        for key in expired_keys:
-            del self._cache[key]
+        Returns:
+            Raw digest of event content
+        """
+        if len(encoded_payload) <= FINGERPRINT_MEMO_MAX_BYTES:
+            return _hash_event_cached(self.hash_algo, event_type, encoded_payload)
+        return _hash_event(self.hash_algo, event_type, encoded_payload)
+
+    def _cleanup_expired(self, now: float) -> None:
+        """
+        Remove expired entries from the head of the expiry queue.
+
+        Args:
+            now: Current monotonic time
+        """
+        expiries = self._expiries
+        while expiries and expiries[0][1] < now:
+            fingerprint, _ = expiries.popleft()
+            del self._ids[fingerprint]
 
     def check_and_add(
         self, event_type: str, payload: dict, event_id: str
@@ -66,18 +236,156 @@ class DeduplicationCache:
         Returns:
             Existing event_id if duplicate, None if new event
         """
-        self._cleanup_expired()
+        if self.window_seconds <= 0:
+            return None
+        return self.check_and_add_encoded(event_type, encode_payload(payload), event_id)
 
-        fingerprint = self._generate_fingerprint(event_type, payload)
+    def check_and_add_encoded(
+        self, event_type: str, encoded_payload: bytes, event_id: str
+    ) -> str | None:
+        """
+        Check if event is duplicate and add to cache, skipping serialization.
+
+        Args:
+            event_type: Event type
+            encoded_payload: Payload bytes from encode_payload()
+            event_id: Event UUID to store
+
+        Returns:
+            Existing event_id if duplicate, None if new event
+        """
+        if self.window_seconds <= 0:
+            return None
+        now = self._now()
+        self._cleanup_expired(now)
+        fingerprint = self._fingerprint_encoded(event_type, encoded_payload)
+        return self._check_and_add_fingerprint(fingerprint, event_id, now)
+
+    def check_and_add_batch(
+        self, events: list[tuple[str, bytes]], event_ids: list[str]
+    ) -> list[str | None]:
+        """
+        Check and add many events in one pass.
+
+        The clock is read and expired entries are cleaned up once for the
+        whole batch. Events are processed in order, so a duplicate later in
+        the same batch resolves to the earlier event's ID.
+
+        Args:
+            events: (event_type, encoded_payload) pairs
+            event_ids: Event UUIDs to store, parallel to events
+
+        Returns:
+            Per event, the existing event_id if duplicate or None if new
+        """
+        if self.window_seconds <= 0:
+            return [None] * len(events)
+        now = self._now()
+        self._cleanup_expired(now)
+        # Bound-method aliases keep attribute lookups out of the loop
+        fingerprint = self._fingerprint_encoded
+        check_and_add = self._check_and_add_fingerprint
+        return [
+            check_and_add(fingerprint(event_type, encoded_payload), event_id, now)
+            for (event_type, encoded_payload), event_id in zip(
+                events, event_ids, strict=True
+            )
+        ]
+
+    def check_and_add_many(
+        self, events: list[tuple[str, dict, str]]
+    ) -> list[str | None]:
+        """
+        Check and add many events with dict payloads in one pass.
 
-        if fingerprint in self._cache:
-            existing_id, _ = self._cache[fingerprint]
+        Batch counterpart of check_and_add(); see check_and_add_batch().
+
+        Args:
+            events: (event_type, payload, event_id) triples
+
+        Returns:
+            Per event, the existing event_id if duplicate or None if new
+        """
+        if self.window_seconds <= 0:
+            return [None] * len(events)
+        return self.check_and_add_batch(
+            [
+                (event_type, encode_payload(payload))
+                for event_type, payload, _ in events
+            ],
+            [event_id for _, _, event_id in events],
+        )
+
+    def discard_batch(
+        self, events: list[tuple[str, bytes]], event_ids: list[str]
+    ) -> None:
+        """
+        Forget events recorded by the check_and_add methods.
+
+        Used when persisting the events fails, so a retry is not reported
+        as a duplicate of an event that was never stored. Entries are only
+        removed while they still map to the given event_id.
+
+        Args:
+            events: (event_type, encoded_payload) pairs
+            event_ids: Event UUIDs that were stored, parallel to events
+        """
+        removed: set[bytes] = set()
+        for (event_type, encoded_payload), event_id in zip(
+            events, event_ids, strict=True
+        ):
+            fingerprint = self._fingerprint_encoded(event_type, encoded_payload)
+            if self._ids.get(fingerprint) == event_id:
+                del self._ids[fingerprint]
+                removed.add(fingerprint)
+        if removed:
+            self._expiries = deque(
+                entry for entry in self._expiries if entry[0] not in removed
+            )
+
+    def _check_and_add_fingerprint(
+        self, fingerprint: bytes, event_id: str, now: float
+    ) -> str | None:
+        """
+        Look up a fingerprint and record it if new.
+
+        Expects expired entries to have been cleaned up at ``now``.
+
+        Args:
+            fingerprint: Event fingerprint
+            event_id: Event UUID to store
+            now: Current monotonic time
+
+        Returns:
+            Existing event_id if duplicate, None if new event
+        """
+        # setdefault probes the dict once for both the hit and the insert;
+        # an unchanged size means the fingerprint was already present
+        ids = self._ids
+        size = len(ids)
+        existing_id = ids.setdefault(fingerprint, event_id)
+        if len(ids) == size:
             return existing_id
 
-        expiry = time.time() + self.window_seconds
-        self._cache[fingerprint] = (event_id, expiry)
+        sketch = self._sketch
+        if (
+            sketch is not None
+            and size >= self.max_size
+            and sketch.increment(fingerprint) < 2
+        ):
+            # First sighting while full: not admitted, nothing evicted
+            del ids[fingerprint]
+            return None
+
+        self._expiries.append((fingerprint, now + self.window_seconds))
+        if size >= self.max_size:
+            oldest, _ = self._expiries.popleft()
+            del self._ids[oldest]
         return None
 
     def clear(self) -> None:
         """Clear all cached entries (for testing)."""
-        self._cache.clear()
+        self._ids.clear()
+        self._expiries.clear()
+        if self._sketch is not None:
+            self._sketch = _CountMinSketch()
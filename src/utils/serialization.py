@@ -0,0 +1,72 @@
+"""
+Canonical JSON serialization for event payloads.
+
+Payload size validation and deduplication fingerprints both work on the
+same canonical bytes, so an ingested payload only needs encoding once.
+"""
+
+import json
+import math
+from typing import Any
+
+import orjson
+
+# Tokens a non-finite float can encode to (orjson: null; stdlib: NaN, Infinity)
+_NON_FINITE_MARKERS = (b"null", b"NaN", b"Infinity")
+
+
+def encode_payload(payload: dict) -> bytes:
+    """
+    Serialize a payload to canonical JSON bytes (sorted keys, compact).
+
+    Args:
+        payload: Event payload dictionary
+
+    Returns:
+        Canonical UTF-8 JSON encoding of the payload
+    """
+    try:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson rejects e.g. integers beyond 64 bits; stdlib handles them
+        return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _is_non_finite(value: Any) -> bool:
+    """
+    Check a decoded JSON value for NaN or infinite floats, recursively.
+
+    Args:
+        value: Payload value
+
+    Returns:
+        True if any float in value is NaN or infinite
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_is_non_finite(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return any(_is_non_finite(item) for item in value)
+    return False
+
+
+def has_non_finite_number(payload: dict, encoded: bytes) -> bool:
+    """
+    Check whether a payload contains NaN or Infinity.
+
+    orjson encodes non-finite floats as null, so without this check
+    {"d": NaN} and {"d": None} would share a canonical encoding. The
+    payload is only walked when its encoding contains null, NaN or
+    Infinity, so typical payloads cost a few byte searches.
+
+    Args:
+        payload: Event payload dictionary
+        encoded: encode_payload(payload)
+
+    Returns:
+        True if any float in the payload is NaN or infinite
+    """
+    if not any(marker in encoded for marker in _NON_FINITE_MARKERS):
+        return False
+    return _is_non_finite(payload)
@@ -0,0 +1,114 @@
+"""Shared helpers for the test suite."""
+
+from typing import Any
+
+import orjson
+from httpx import Response
+
+from src.models.event import Event
+
+
+def response_json(response: Response) -> Any:
+    """
+    Parse an httpx response body with orjson, caching the result.
+
+    Tests often read the same body several times; the parsed value is
+    stored on the response so repeat calls skip re-parsing.
+
+    Args:
+        response: httpx Response to decode
+
+    Returns:
+        Decoded JSON body
+    """
+    try:
+        return response._parsed_json  # type: ignore[attr-defined]
+    except AttributeError:
+        response._parsed_json = orjson.loads(response.content)  # type: ignore[attr-defined]
+        return response._parsed_json  # type: ignore[attr-defined]
+
+
+def make_event(i: int = 0, **overrides: Any) -> Event:
+    """
+    Build an undelivered test Event without running validation.
+
+    Uses Event.model_construct, so the defaults and any overrides must
+    already be valid field values.
+
+    Args:
+        i: Index used for event_id, payload and a 12:MM timestamp
+        **overrides: Field values replacing the defaults
+
+    Returns:
+        Event model
+    """
+    timestamp = f"2025-11-11T12:{i:02d}:00Z"
+    fields: dict[str, Any] = {
+        "event_id": f"event-{i}",
+        "timestamp": timestamp,
+        "event_type": "test.event",
+        "payload": {"index": i},
+        "source": None,
+        "metadata": None,
+        "delivered": False,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "ttl": None,
+    }
+    fields.update(overrides)
+    return Event.model_construct(**fields)
+
+
+class AsyncStub:
+    """
+    Lightweight awaitable stand-in for a single AsyncMock method.
+
+    Records each call as an ``(args, kwargs)`` tuple and returns
+    ``return_value``; exposes the handful of AsyncMock assertions the
+    service tests rely on without AsyncMock's spec and coroutine machinery.
+    """
+
+    def __init__(self, return_value: Any = None) -> None:
+        """Create a stub that resolves to return_value."""
+        self.return_value = return_value
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Record the call and return return_value."""
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    @property
+    def call_count(self) -> int:
+        """Number of times the stub has been awaited."""
+        return len(self.calls)
+
+    @property
+    def call_args(self) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
+        """Arguments of the most recent call, or None if never called."""
+        return self.calls[-1] if self.calls else None
+
+    def assert_not_called(self) -> None:
+        """Assert the stub was never awaited."""
+        assert not self.calls, f"Expected no calls, got {self.calls}"
+
+    def assert_called_once(self) -> None:
+        """Assert the stub was awaited exactly once."""
+        assert len(self.calls) == 1, f"Expected 1 call, got {len(self.calls)}"
+
+    def assert_called_with(self, *args: Any, **kwargs: Any) -> None:
+        """Assert the most recent call used exactly these arguments."""
+        assert self.calls, "Expected a call, got none"
+        expected = (args, kwargs)
+        assert self.calls[-1] == expected, f"Expected {expected}, got {self.calls[-1]}"
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        """Assert the stub was awaited once, with exactly these arguments."""
+        self.assert_called_once()
+        self.assert_called_with(*args, **kwargs)
+
+    def reset_mock(self, return_value: bool = False) -> None:
+        """Forget recorded calls, optionally clearing return_value too."""
+        self.calls.clear()
+        if return_value:
+            self.return_value = None
@@ -1,8 +1,7 @@
 """Pytest fixtures for integration tests with LocalStack DynamoDB."""
 
-import asyncio
 import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
 
 import aioboto3
 import pytest
@@ -16,14 +15,6 @@ from src.models.api_key import ApiKey
 from src.repositories.api_key_repository import ApiKeyRepository
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="function")
 async def dynamodb_tables() -> AsyncGenerator:
     """
@@ -120,9 +111,14 @@ async def dynamodb_tables() -> AsyncGenerator:
             pass
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def api_client() -> AsyncGenerator[AsyncClient, None]:
-    """Create async HTTP client for testing API endpoints."""
+    """
+    Create async HTTP client for testing API endpoints.
+
+    Session-scoped: the client is stateless between requests, so one
+    instance is shared across the whole integration run.
+    """
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as client:
@@ -9,12 +9,12 @@ from httpx import AsyncClient
 from src.auth.api_key import hash_api_key
 from src.models.api_key import ApiKey
 from src.repositories.api_key_repository import ApiKeyRepository
+from tests.helpers import response_json
 
 # Mark all tests in this module as integration tests
 pytestmark = pytest.mark.integration
 
 
-@pytest.mark.asyncio
 async def test_authentication_missing_header(api_client: AsyncClient, dynamodb_tables):
     """Test that requests without Authorization header return 401."""
     event_data = {"event_type": "test.event", "payload": {"test": "data"}}
@@ -22,13 +22,12 @@ async def test_authentication_missing_header(api_client: AsyncClient, dynamodb_t
     response = await api_client.post("/events", json=event_data)
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "UNAUTHORIZED"
     assert "authorization" in data["message"].lower()
 
 
-@pytest.mark.asyncio
 async def test_authentication_invalid_format(api_client: AsyncClient, dynamodb_tables):
     """Test that malformed Authorization header returns 401."""
     event_data = {"event_type": "test.event", "payload": {"test": "data"}}
@@ -41,7 +40,6 @@ async def test_authentication_invalid_format(api_client: AsyncClient, dynamodb_t
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-@pytest.mark.asyncio
 async def test_authentication_invalid_key(api_client: AsyncClient, dynamodb_tables):
     """Test that invalid API key returns 401."""
     event_data = {"event_type": "test.event", "payload": {"test": "data"}}
@@ -53,12 +51,11 @@ async def test_authentication_invalid_key(api_client: AsyncClient, dynamodb_tabl
     )
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "UNAUTHORIZED"
 
 
-@pytest.mark.asyncio
 async def test_authentication_valid_key(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -68,11 +65,10 @@ async def test_authentication_valid_key(
     response = await api_client.post("/events", json=event_data, headers=auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "accepted"
 
 
-@pytest.mark.asyncio
 async def test_authentication_revoked_key(api_client: AsyncClient, dynamodb_tables):
     """Test that revoked API key returns 403."""
     # Create a revoked API key
@@ -97,12 +93,11 @@ async def test_authentication_revoked_key(api_client: AsyncClient, dynamodb_tabl
     )
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "FORBIDDEN"
 
 
-@pytest.mark.asyncio
 async def test_authentication_inactive_key(api_client: AsyncClient, dynamodb_tables):
     """Test that inactive API key returns 403."""
     # Create an inactive API key
@@ -129,7 +124,6 @@ async def test_authentication_inactive_key(api_client: AsyncClient, dynamodb_tab
     assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
-@pytest.mark.asyncio
 async def test_rate_limiting_exceed_limit(api_client: AsyncClient, dynamodb_tables):
     """
     Test that exceeding rate limit returns 429.
@@ -166,7 +160,7 @@ async def test_rate_limiting_exceed_limit(api_client: AsyncClient, dynamodb_tabl
     # Make third request (should be rate limited)
     response3 = await api_client.post("/events", json=event_data, headers=headers)
     assert response3.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-    data = response3.json()
+    data = response_json(response3)
     assert data["status"] == "error"
     assert data["error_code"] == "RATE_LIMIT_EXCEEDED"
 
@@ -176,7 +170,7 @@ async def test_rate_limiting_exceed_limit(api_client: AsyncClient, dynamodb_tabl
     assert retry_after > 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
 async def test_rate_limiting_reset_after_window(
     api_client: AsyncClient, dynamodb_tables
 ):
@@ -222,7 +216,6 @@ async def test_rate_limiting_reset_after_window(
     assert response3.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
 async def test_rate_limiting_per_key_isolation(
     api_client: AsyncClient, dynamodb_tables
 ):
@@ -285,7 +278,6 @@ async def test_rate_limiting_per_key_isolation(
     assert response3.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
 async def test_authentication_all_endpoints_protected(
     api_client: AsyncClient, dynamodb_tables
 ):
@@ -4,11 +4,12 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from tests.helpers import response_json
+
 # Mark all tests in this module as integration tests
 pytestmark = pytest.mark.integration
 
 
-@pytest.mark.asyncio
 async def test_full_event_lifecycle(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -39,7 +40,7 @@ async def test_full_event_lifecycle(
     )
 
     assert create_response.status_code == status.HTTP_200_OK
-    create_data = create_response.json()
+    create_data = response_json(create_response)
     assert create_data["status"] == "accepted"
     assert "event_id" in create_data
     assert "timestamp" in create_data
@@ -51,7 +52,7 @@ async def test_full_event_lifecycle(
     inbox_response = await api_client.get("/inbox", headers=auth_headers)
 
     assert inbox_response.status_code == status.HTTP_200_OK
-    inbox_data = inbox_response.json()
+    inbox_data = response_json(inbox_response)
     assert "events" in inbox_data
     assert len(inbox_data["events"]) == 1
 
@@ -66,7 +67,7 @@ async def test_full_event_lifecycle(
     )
 
     assert get_response.status_code == status.HTTP_200_OK
-    event_detail = get_response.json()
+    event_detail = response_json(get_response)
     assert event_detail["event_id"] == event_id
     assert event_detail["event_type"] == "user.signup"
     assert event_detail["payload"]["email"] == "test@example.com"
@@ -83,7 +84,7 @@ async def test_full_event_lifecycle(
     inbox_after_delete = await api_client.get("/inbox", headers=auth_headers)
 
     assert inbox_after_delete.status_code == status.HTTP_200_OK
-    inbox_after_data = inbox_after_delete.json()
+    inbox_after_data = response_json(inbox_after_delete)
     assert len(inbox_after_data["events"]) == 0
 
     # Step 6: Verify event still exists but marked as delivered
@@ -92,11 +93,10 @@ async def test_full_event_lifecycle(
     )
 
     assert get_after_delete.status_code == status.HTTP_200_OK
-    delivered_event = get_after_delete.json()
+    delivered_event = response_json(get_after_delete)
     assert delivered_event["delivered"] is True
 
 
-@pytest.mark.asyncio
 async def test_pagination_with_multiple_events(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -119,7 +119,7 @@ async def test_pagination_with_multiple_events(
         )
 
         assert response.status_code == status.HTTP_200_OK
-        event_ids.append(response.json()["event_id"])
+        event_ids.append(response_json(response)["event_id"])
 
     # Fetch first page (limit=5)
     page1_response = await api_client.get(
@@ -127,7 +127,7 @@ async def test_pagination_with_multiple_events(
     )
 
     assert page1_response.status_code == status.HTTP_200_OK
-    page1_data = page1_response.json()
+    page1_data = response_json(page1_response)
     assert len(page1_data["events"]) == 5
     assert page1_data["pagination"]["has_more"] is True
     assert page1_data["pagination"]["next_cursor"] is not None
@@ -139,7 +139,7 @@ async def test_pagination_with_multiple_events(
     )
 
     assert page2_response.status_code == status.HTTP_200_OK
-    page2_data = page2_response.json()
+    page2_data = response_json(page2_response)
     assert len(page2_data["events"]) == 5
     assert page2_data["pagination"]["has_more"] is False
     assert page2_data["pagination"]["next_cursor"] is None
@@ -154,7 +154,6 @@ async def test_pagination_with_multiple_events(
     assert all_fetched_ids == set(event_ids)
 
 
-@pytest.mark.asyncio
 async def test_empty_inbox(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -162,13 +161,12 @@ async def test_empty_inbox(
     response = await api_client.get("/inbox", headers=auth_headers)
 
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
+    data = response_json(response)
     assert data["events"] == []
     assert data["pagination"]["has_more"] is False
     assert data["pagination"]["next_cursor"] is None
 
 
-@pytest.mark.asyncio
 async def test_delete_idempotency(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -183,8 +181,8 @@ async def test_delete_idempotency(
         "/events", json=event_data, headers=auth_headers
     )
 
-    event_id = create_response.json()["event_id"]
-    timestamp = create_response.json()["timestamp"]
+    event_id = response_json(create_response)["event_id"]
+    timestamp = response_json(create_response)["timestamp"]
 
     # Delete first time
     delete1 = await api_client.delete(
@@ -199,7 +197,6 @@ async def test_delete_idempotency(
     assert delete2.status_code == status.HTTP_204_NO_CONTENT
 
 
-@pytest.mark.asyncio
 async def test_get_nonexistent_event(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -211,12 +208,11 @@ async def test_get_nonexistent_event(
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "EVENT_NOT_FOUND"
 
 
-@pytest.mark.asyncio
 async def test_delete_nonexistent_event(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -228,12 +224,11 @@ async def test_delete_nonexistent_event(
     )
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "EVENT_NOT_FOUND"
 
 
-@pytest.mark.asyncio
 async def test_pagination_with_max_limit(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -243,12 +238,11 @@ async def test_pagination_with_max_limit(
     )
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert "limit" in data["message"].lower()
 
 
-@pytest.mark.asyncio
 async def test_pagination_with_invalid_cursor(
     api_client: AsyncClient, auth_headers: dict[str, str], dynamodb_tables
 ):
@@ -258,6 +252,6 @@ async def test_pagination_with_invalid_cursor(
     )
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert "cursor" in data["message"].lower()
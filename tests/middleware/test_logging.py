@@ -10,6 +10,7 @@ from fastapi import FastAPI, Request
 from httpx import ASGITransport, AsyncClient
 
 from src.middleware.logging import LoggingMiddleware
+from tests.helpers import response_json
 
 
 @pytest.fixture
@@ -31,7 +32,6 @@ def app_with_logging() -> FastAPI:
     return app
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_adds_correlation_id(
     app_with_logging: FastAPI,
 ) -> None:
@@ -41,13 +41,12 @@ async def test_logging_middleware_adds_correlation_id(
         response = await client.get("/test")
 
     assert response.status_code == 200
-    data = response.json()
+    data = response_json(response)
     assert "correlation_id" in data
     # Should be a valid UUID
     uuid.UUID(data["correlation_id"])
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_uses_existing_correlation_id(
     app_with_logging: FastAPI,
 ) -> None:
@@ -58,11 +57,10 @@ async def test_logging_middleware_uses_existing_correlation_id(
         response = await client.get("/test", headers={"X-Request-ID": correlation_id})
 
     assert response.status_code == 200
-    data = response.json()
+    data = response_json(response)
     assert data["correlation_id"] == correlation_id
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_adds_correlation_id_to_response(
     app_with_logging: FastAPI,
 ) -> None:
@@ -77,7 +75,6 @@ async def test_logging_middleware_adds_correlation_id_to_response(
     uuid.UUID(response.headers["x-request-id"])
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_logs_request_start(
     app_with_logging: FastAPI,
 ) -> None:
@@ -99,7 +96,6 @@ async def test_logging_middleware_logs_request_start(
         assert extra["context"]["query_params"] == {"foo": "bar"}
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_logs_response(
     app_with_logging: FastAPI,
 ) -> None:
@@ -121,7 +117,6 @@ async def test_logging_middleware_logs_response(
         assert extra["context"]["response_time_ms"] >= 0
 
 
-@pytest.mark.asyncio
 async def test_logging_middleware_logs_errors(
     app_with_logging: FastAPI,
 ) -> None:
@@ -142,7 +137,6 @@ async def test_logging_middleware_logs_errors(
         assert "exc_info" in error_call[1]
 
 
-@pytest.mark.asyncio
 async def test_json_formatter_output() -> None:
     """Test that JSONFormatter produces valid JSON."""
     import logging
@@ -183,7 +177,6 @@ async def test_json_formatter_output() -> None:
     assert "logger" in log_data
 
 
-@pytest.mark.asyncio
 async def test_json_formatter_includes_exception_info() -> None:
     """Test that JSONFormatter includes exception details."""
     import logging
@@ -215,7 +208,6 @@ async def test_json_formatter_includes_exception_info() -> None:
     assert "Test exception" in log_data["exception"]
 
 
-@pytest.mark.asyncio
 async def test_json_formatter_debug_includes_location() -> None:
     """Test that JSONFormatter includes file location at DEBUG level."""
     import logging
@@ -59,7 +59,6 @@ async def setup_dynamodb():
             yield
 
 
-@pytest.mark.asyncio
 async def test_create_api_key(
     setup_dynamodb,
     repository: ApiKeyRepository,
@@ -74,7 +73,6 @@ async def test_create_api_key(
     assert result.status == "active"
 
 
-@pytest.mark.asyncio
 async def test_get_by_id(
     setup_dynamodb,
     repository: ApiKeyRepository,
@@ -91,7 +89,6 @@ async def test_get_by_id(
     assert result.key_hash == api_key.key_hash
 
 
-@pytest.mark.asyncio
 async def test_get_by_id_not_found(
     setup_dynamodb, repository: ApiKeyRepository
 ) -> None:
@@ -101,7 +98,6 @@ async def test_get_by_id_not_found(
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_get_by_key_hash(
     setup_dynamodb,
     repository: ApiKeyRepository,
@@ -118,7 +114,6 @@ async def test_get_by_key_hash(
     assert result.key_hash == api_key.key_hash
 
 
-@pytest.mark.asyncio
 async def test_get_by_key_hash_not_found(
     setup_dynamodb, repository: ApiKeyRepository
 ) -> None:
@@ -0,0 +1,81 @@
+"""Unit tests for BaseRepository batch writes."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.exceptions import BatchWriteError
+from src.repositories.base import BaseRepository
+
+_ITEMS = [
+    {"event_id": f"event-{i}", "timestamp": "2025-11-11T12:00:00Z"} for i in range(3)
+]
+
+
+def _repository_with(batch_write_item: AsyncMock) -> BaseRepository:
+    """Build a repository whose DynamoDB resource only supports batch writes."""
+    repository = BaseRepository("zapier-events")
+    session = MagicMock()
+    session.resource.return_value.__aenter__.return_value = SimpleNamespace(
+        batch_write_item=batch_write_item
+    )
+    repository.session = session
+    return repository
+
+
+async def test_batch_put_items_resubmits_unprocessed_items():
+    """Test UnprocessedItems are retried with backoff until written."""
+    unprocessed = {"zapier-events": [{"PutRequest": {"Item": _ITEMS[0]}}]}
+    batch_write_item = AsyncMock(
+        side_effect=[{"UnprocessedItems": unprocessed}, {"UnprocessedItems": {}}]
+    )
+    repository = _repository_with(batch_write_item)
+
+    with patch("src.repositories.base.asyncio.sleep", new=AsyncMock()) as sleep:
+        await repository.batch_put_items(_ITEMS, base_delay=0.05)
+
+    assert batch_write_item.await_count == 2
+    retry = batch_write_item.await_args_list[1].kwargs["RequestItems"]
+    assert retry == unprocessed
+    sleep.assert_awaited_once_with(0.05)
+
+
+async def test_batch_put_items_raises_when_retries_exhausted():
+    """Test items still unprocessed after max_retries raise a 503 error."""
+    unprocessed = {"zapier-events": [{"PutRequest": {"Item": _ITEMS[0]}}]}
+    batch_write_item = AsyncMock(return_value={"UnprocessedItems": unprocessed})
+    repository = _repository_with(batch_write_item)
+
+    with (
+        patch("src.repositories.base.asyncio.sleep", new=AsyncMock()) as sleep,
+        pytest.raises(BatchWriteError) as exc_info,
+    ):
+        await repository.batch_put_items(_ITEMS, max_retries=2, base_delay=0.05)
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.unprocessed_items == [_ITEMS[0]]
+    assert batch_write_item.await_count == 3
+    assert [c.args[0] for c in sleep.await_args_list] == [0.05, 0.1]
+
+
+async def test_batch_put_items_reports_only_unwritten_chunk():
+    """Test a failing later chunk reports its items but not earlier chunks."""
+    items = [{"event_id": f"event-{i}", "timestamp": "2025-11-11"} for i in range(30)]
+
+    async def batch_write_item(**kwargs):
+        # First chunk (25 items) succeeds; the second is never processed
+        request_items = kwargs["RequestItems"]
+        if len(request_items["zapier-events"]) == 25:
+            return {"UnprocessedItems": {}}
+        return {"UnprocessedItems": request_items}
+
+    repository = _repository_with(AsyncMock(side_effect=batch_write_item))
+
+    with (
+        patch("src.repositories.base.asyncio.sleep", new=AsyncMock()),
+        pytest.raises(BatchWriteError) as exc_info,
+    ):
+        await repository.batch_put_items(items, max_retries=1)
+
+    assert exc_info.value.unprocessed_items == items[25:]
@@ -89,7 +89,6 @@ async def setup_dynamodb():
             yield
 
 
-@pytest.mark.asyncio
 async def test_create_event(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -102,7 +101,6 @@ async def test_create_event(
     assert result.event_type == event.event_type
 
 
-@pytest.mark.asyncio
 async def test_get_by_id(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -117,7 +115,6 @@ async def test_get_by_id(
     assert result.payload == event.payload
 
 
-@pytest.mark.asyncio
 async def test_get_by_id_not_found(setup_dynamodb, repository: EventRepository) -> None:
     """Test retrieving non-existent event."""
     result = await repository.get_by_id("nonexistent", "2025-01-01T00:00:00Z")
@@ -125,7 +122,6 @@ async def test_get_by_id_not_found(setup_dynamodb, repository: EventRepository)
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_mark_delivered(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -143,7 +139,6 @@ async def test_mark_delivered(
 # Error Scenario Tests
 
 
-@pytest.mark.asyncio
 async def test_mark_delivered_nonexistent_event(
     setup_dynamodb, repository: EventRepository
 ) -> None:
@@ -153,7 +148,6 @@ async def test_mark_delivered_nonexistent_event(
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_create_with_malformed_data_raises_error() -> None:
     """Test creating event with invalid data raises error."""
     from pydantic import ValidationError
@@ -166,7 +160,6 @@ async def test_create_with_malformed_data_raises_error() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_list_undelivered_empty_table(
     setup_dynamodb, repository: EventRepository
 ) -> None:
@@ -177,7 +170,6 @@ async def test_list_undelivered_empty_table(
     assert next_key is None
 
 
-@pytest.mark.asyncio
 async def test_list_undelivered_with_invalid_cursor(
     setup_dynamodb, repository: EventRepository
 ) -> None:
@@ -194,7 +186,6 @@ async def test_list_undelivered_with_invalid_cursor(
     assert isinstance(events, list)
 
 
-@pytest.mark.asyncio
 async def test_get_by_id_with_empty_strings(
     setup_dynamodb, repository: EventRepository
 ) -> None:
@@ -204,7 +195,6 @@ async def test_get_by_id_with_empty_strings(
     assert result is None
 
 
-@pytest.mark.asyncio
 async def test_create_multiple_events_same_type(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -229,7 +219,21 @@ async def test_create_multiple_events_same_type(
     assert retrieved1.event_id != retrieved2.event_id
 
 
-@pytest.mark.asyncio
+async def test_batch_create_spans_multiple_requests(
+    setup_dynamodb, repository: EventRepository, event_data: dict
+) -> None:
+    """Test batch_create writes more events than one BatchWriteItem allows."""
+    events = [Event(**{**event_data, "event_id": str(uuid4())}) for _ in range(30)]
+
+    result = await repository.batch_create(events)
+
+    assert result == events
+    for event in (events[0], events[24], events[29]):
+        retrieved = await repository.get_by_id(event.event_id, event.timestamp)
+        assert retrieved is not None
+        assert retrieved.delivered is False
+
+
 async def test_mark_delivered_idempotent(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -248,7 +252,6 @@ async def test_mark_delivered_idempotent(
     assert result2.delivered is True
 
 
-@pytest.mark.asyncio
 async def test_list_undelivered_excludes_delivered_events(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -272,7 +275,6 @@ async def test_list_undelivered_excludes_delivered_events(
     assert events[0].event_id == event1.event_id
 
 
-@pytest.mark.asyncio
 async def test_create_with_very_large_payload(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -295,7 +297,6 @@ async def test_create_with_very_large_payload(
     assert len(retrieved.payload["large_field"]) == target_size
 
 
-@pytest.mark.asyncio
 async def test_list_undelivered_pagination_boundary(
     setup_dynamodb, repository: EventRepository, event_data: dict
 ) -> None:
@@ -316,7 +317,6 @@ async def test_list_undelivered_pagination_boundary(
     assert next_key is None
 
 
-@pytest.mark.asyncio
 async def test_deserialize_event_handles_missing_optional_fields(
     setup_dynamodb, repository: EventRepository
 ) -> None:
@@ -0,0 +1,39 @@
+"""Shared fixtures for route tests."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.main import app
+from src.routes.events import get_event_repository
+from src.services.event_service import get_dedup_cache
+from src.utils.deduplication import DeduplicationCache
+
+
+@pytest.fixture
+def mock_event_repository() -> Generator[AsyncMock, None, None]:
+    """
+    Install a mock EventRepository through FastAPI dependency overrides.
+
+    Yields:
+        AsyncMock standing in for EventRepository
+    """
+    repository = AsyncMock()
+    app.dependency_overrides[get_event_repository] = lambda: repository
+    yield repository
+    app.dependency_overrides.pop(get_event_repository, None)
+
+
+@pytest.fixture(autouse=True)
+def dedup_cache() -> Generator[DeduplicationCache, None, None]:
+    """
+    Give each route test its own dedup cache instead of the shared one.
+
+    Yields:
+        DeduplicationCache injected into the event routes
+    """
+    cache = DeduplicationCache()
+    app.dependency_overrides[get_dedup_cache] = lambda: cache
+    yield cache
+    app.dependency_overrides.pop(get_dedup_cache, None)
@@ -3,15 +3,12 @@
 import json
 from unittest.mock import AsyncMock
 
-import pytest
-
 from src.exceptions import (
     EventNotFoundError,
     RequestTooLargeError,
 )
 
 
-@pytest.mark.asyncio
 async def test_validation_error_includes_correlation_id() -> None:
     """Test that validation errors include correlation ID."""
     from unittest.mock import AsyncMock
@@ -42,7 +39,6 @@ async def test_validation_error_includes_correlation_id() -> None:
     assert "validation_errors" in data["details"]
 
 
-@pytest.mark.asyncio
 async def test_validation_error_has_actionable_messages() -> None:
     """Test that validation errors have clear, actionable messages."""
     from unittest.mock import AsyncMock
@@ -90,7 +86,6 @@ async def test_validation_error_has_actionable_messages() -> None:
         assert not error["field"].startswith("body")
 
 
-@pytest.mark.asyncio
 async def test_rate_limit_error_includes_retry_after_header() -> None:
     """Test that rate limit errors include Retry-After header."""
     from fastapi import Request
@@ -123,7 +118,6 @@ async def test_rate_limit_error_includes_retry_after_header() -> None:
     assert body["details"]["retry_after"] == 45
 
 
-@pytest.mark.asyncio
 async def test_request_too_large_error() -> None:
     """Test that RequestTooLargeError returns proper 413 response."""
     from unittest.mock import AsyncMock
@@ -156,7 +150,6 @@ async def test_request_too_large_error() -> None:
     assert "request_size" in data["details"]
 
 
-@pytest.mark.asyncio
 async def test_service_unavailable_error() -> None:
     """Test that service errors return 503."""
     from fastapi import Request
@@ -183,7 +176,6 @@ async def test_service_unavailable_error() -> None:
     assert "retry_after" in body["details"]
 
 
-@pytest.mark.asyncio
 async def test_internal_error_includes_correlation_id() -> None:
     """Test that internal errors include correlation ID."""
     from fastapi import Request
@@ -210,7 +202,6 @@ async def test_internal_error_includes_correlation_id() -> None:
     assert "contact support" in body["message"].lower()
 
 
-@pytest.mark.asyncio
 async def test_error_response_without_correlation_id() -> None:
     """Test that errors work even without correlation ID."""
     from fastapi import Request
@@ -236,7 +227,6 @@ async def test_error_response_without_correlation_id() -> None:
     assert "correlation_id" not in body or body["correlation_id"] is None
 
 
-@pytest.mark.asyncio
 async def test_dynamodb_timeout_returns_503() -> None:
     """Test that DynamoDB timeout errors return 503."""
 
@@ -262,7 +252,6 @@ async def test_dynamodb_timeout_returns_503() -> None:
     assert body["error_code"] == "SERVICE_UNAVAILABLE"
 
 
-@pytest.mark.asyncio
 async def test_validation_error_with_multiple_fields() -> None:
     """Test that validation errors with multiple fields are formatted clearly."""
     from unittest.mock import AsyncMock
@@ -313,7 +302,6 @@ async def test_validation_error_with_multiple_fields() -> None:
     assert len(set(fields)) == 3
 
 
-@pytest.mark.asyncio
 async def test_event_not_found_error_format() -> None:
     """Test EventNotFoundError returns proper 404 response."""
     from fastapi import Request
@@ -8,6 +8,7 @@ from httpx import ASGITransport, AsyncClient
 from src.auth.dependencies import require_api_key
 from src.main import app
 from src.models.api_key import ApiKey
+from tests.helpers import response_json
 
 
 @pytest.fixture
@@ -23,7 +24,6 @@ def mock_api_key():
     )
 
 
-@pytest.mark.asyncio
 async def test_delete_event_success(mock_api_key):
     """Test successful event deletion."""
 
@@ -50,7 +50,6 @@ async def test_delete_event_success(mock_api_key):
     assert response.content == b""
 
 
-@pytest.mark.asyncio
 async def test_delete_event_not_found(mock_api_key):
     """Test deleting non-existent event returns 404."""
 
@@ -74,13 +73,12 @@ async def test_delete_event_not_found(mock_api_key):
     app.dependency_overrides.clear()
 
     assert response.status_code == 404
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "NOT_FOUND"
     assert "nonexistent-id" in data["message"]
 
 
-@pytest.mark.asyncio
 async def test_delete_event_idempotent(mock_api_key):
     """Test that DELETE is idempotent (already delivered returns 204)."""
 
@@ -116,7 +114,6 @@ async def test_delete_event_idempotent(mock_api_key):
     assert mock_service.mark_delivered.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_delete_event_unauthorized():
     """Test DELETE without API key returns 401."""
     transport = ASGITransport(app=app)
@@ -127,12 +124,11 @@ async def test_delete_event_unauthorized():
         )
 
     assert response.status_code == 401
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "UNAUTHORIZED"
 
 
-@pytest.mark.asyncio
 async def test_delete_event_missing_timestamp(mock_api_key):
     """Test DELETE without timestamp parameter returns 400."""
 
@@ -153,7 +149,6 @@ async def test_delete_event_missing_timestamp(mock_api_key):
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_delete_event_service_error(mock_api_key):
     """Test DELETE handles service errors gracefully."""
 
@@ -177,6 +172,6 @@ async def test_delete_event_service_error(mock_api_key):
     app.dependency_overrides.clear()
 
     assert response.status_code == 500
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "INTERNAL_ERROR"
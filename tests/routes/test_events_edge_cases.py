@@ -9,6 +9,8 @@ from httpx import ASGITransport, AsyncClient
 from src.auth.api_key import hash_api_key
 from src.main import app
 from src.models.api_key import ApiKey
+from src.utils.cursor import encode_cursor
+from tests.helpers import response_json
 
 
 @pytest.fixture
@@ -29,14 +31,12 @@ def mock_api_key_model(valid_api_key):
     )
 
 
-@pytest.mark.asyncio
 async def test_post_event_with_single_char_event_type(
-    valid_api_key, mock_api_key_model
+    valid_api_key, mock_api_key_model, mock_event_repository
 ):
     """Test POST /events with single character event_type (minimum valid)."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -44,9 +44,8 @@ async def test_post_event_with_single_char_event_type(
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.create = AsyncMock(return_value=None)
-        mock_repo_class.return_value = mock_repo
 
         request_data = {"event_type": "a", "payload": {"test": "data"}}
 
@@ -60,16 +59,16 @@ async def test_post_event_with_single_char_event_type(
             )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert data["status"] == "accepted"
 
 
-@pytest.mark.asyncio
-async def test_post_event_with_max_length_event_type(valid_api_key, mock_api_key_model):
+async def test_post_event_with_max_length_event_type(
+    valid_api_key, mock_api_key_model, mock_event_repository
+):
     """Test POST /events with 255 character event_type (maximum valid)."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -77,9 +76,8 @@ async def test_post_event_with_max_length_event_type(valid_api_key, mock_api_key
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.create = AsyncMock(return_value=None)
-        mock_repo_class.return_value = mock_repo
 
         request_data = {"event_type": "a" * 255, "payload": {"test": "data"}}
 
@@ -95,7 +93,6 @@ async def test_post_event_with_max_length_event_type(valid_api_key, mock_api_key
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
 async def test_post_event_with_empty_event_type(valid_api_key, mock_api_key_model):
     """Test POST /events with empty event_type returns validation error."""
     with (
@@ -121,7 +118,6 @@ async def test_post_event_with_empty_event_type(valid_api_key, mock_api_key_mode
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
 async def test_post_event_with_too_long_event_type(valid_api_key, mock_api_key_model):
     """Test POST /events with 256+ char event_type returns validation error."""
     with (
@@ -147,12 +143,12 @@ async def test_post_event_with_too_long_event_type(valid_api_key, mock_api_key_m
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
-async def test_post_event_with_empty_payload(valid_api_key, mock_api_key_model):
+async def test_post_event_with_empty_payload(
+    valid_api_key, mock_api_key_model, mock_event_repository
+):
     """Test POST /events with empty payload dictionary."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -160,9 +156,8 @@ async def test_post_event_with_empty_payload(valid_api_key, mock_api_key_model):
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.create = AsyncMock(return_value=None)
-        mock_repo_class.return_value = mock_repo
 
         request_data = {"event_type": "test.empty", "payload": {}}
 
@@ -178,7 +173,6 @@ async def test_post_event_with_empty_payload(valid_api_key, mock_api_key_model):
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
 async def test_post_event_with_very_large_payload(valid_api_key, mock_api_key_model):
     """Test POST /events with payload exceeding 256KB."""
     with (
@@ -210,14 +204,12 @@ async def test_post_event_with_very_large_payload(valid_api_key, mock_api_key_mo
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
 async def test_post_event_with_complex_nested_payload(
-    valid_api_key, mock_api_key_model
+    valid_api_key, mock_api_key_model, mock_event_repository
 ):
     """Test POST /events with deeply nested payload structure."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -225,9 +217,8 @@ async def test_post_event_with_complex_nested_payload(
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.create = AsyncMock(return_value=None)
-        mock_repo_class.return_value = mock_repo
 
         complex_payload = {
             "level1": {
@@ -257,12 +248,12 @@ async def test_post_event_with_complex_nested_payload(
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_with_limit_one(valid_api_key, mock_api_key_model):
+async def test_get_inbox_with_limit_one(
+    valid_api_key, mock_api_key_model, mock_event_repository
+):
     """Test GET /inbox with limit=1 (minimum valid value)."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -270,9 +261,8 @@ async def test_get_inbox_with_limit_one(valid_api_key, mock_api_key_model):
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([], None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -285,12 +275,12 @@ async def test_get_inbox_with_limit_one(valid_api_key, mock_api_key_model):
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_with_limit_200(valid_api_key, mock_api_key_model):
+async def test_get_inbox_with_limit_200(
+    valid_api_key, mock_api_key_model, mock_event_repository
+):
     """Test GET /inbox with limit=200 (maximum valid value)."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -298,9 +288,8 @@ async def test_get_inbox_with_limit_200(valid_api_key, mock_api_key_model):
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([], None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -313,12 +302,12 @@ async def test_get_inbox_with_limit_200(valid_api_key, mock_api_key_model):
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_with_invalid_cursor(valid_api_key, mock_api_key_model):
+async def test_get_inbox_with_invalid_cursor(
+    valid_api_key, mock_api_key_model, mock_event_repository
+):
     """Test GET /inbox with malformed cursor."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -326,9 +315,8 @@ async def test_get_inbox_with_invalid_cursor(valid_api_key, mock_api_key_model):
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([], None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -342,14 +330,12 @@ async def test_get_inbox_with_invalid_cursor(valid_api_key, mock_api_key_model):
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_with_cursor_special_chars(valid_api_key, mock_api_key_model):
+async def test_get_inbox_with_cursor_special_chars(
+    valid_api_key, mock_api_key_model, mock_event_repository
+):
     """Test GET /inbox with cursor containing special characters."""
-    import json
-
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -357,15 +343,14 @@ async def test_get_inbox_with_cursor_special_chars(valid_api_key, mock_api_key_m
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([], None))
-        mock_repo_class.return_value = mock_repo
 
         cursor_data = {
             "event_id": "test-!@#$%",
             "timestamp": "2025-11-11T12:00:00Z",
         }
-        cursor = json.dumps(cursor_data)
+        cursor = encode_cursor(cursor_data)
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -378,7 +363,6 @@ async def test_get_inbox_with_cursor_special_chars(valid_api_key, mock_api_key_m
         assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.asyncio
 async def test_get_inbox_with_negative_limit_returns_400(
     valid_api_key, mock_api_key_model
 ):
@@ -404,7 +388,6 @@ async def test_get_inbox_with_negative_limit_returns_400(
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
 async def test_post_event_missing_payload_field(valid_api_key, mock_api_key_model):
     """Test POST /events missing required payload field."""
     with (
@@ -431,7 +414,6 @@ async def test_post_event_missing_payload_field(valid_api_key, mock_api_key_mode
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
 async def test_post_event_missing_event_type_field(valid_api_key, mock_api_key_model):
     """Test POST /events missing required event_type field."""
     with (
@@ -458,7 +440,6 @@ async def test_post_event_missing_event_type_field(valid_api_key, mock_api_key_m
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
 async def test_post_event_with_null_payload(valid_api_key, mock_api_key_model):
     """Test POST /events with null payload."""
     with (
@@ -484,7 +465,6 @@ async def test_post_event_with_null_payload(valid_api_key, mock_api_key_model):
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
 async def test_post_event_with_array_payload(valid_api_key, mock_api_key_model):
     """Test POST /events with array instead of object for payload."""
     with (
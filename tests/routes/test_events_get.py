@@ -9,6 +9,7 @@ from src.auth.dependencies import require_api_key
 from src.main import app
 from src.models.api_key import ApiKey
 from src.schemas.event import EventResponse
+from tests.helpers import response_json
 
 
 @pytest.fixture
@@ -39,7 +40,6 @@ def mock_event_response():
     )
 
 
-@pytest.mark.asyncio
 async def test_get_event_success(mock_api_key, mock_event_response):
     """Test successful event retrieval."""
 
@@ -63,7 +63,7 @@ async def test_get_event_success(mock_api_key, mock_event_response):
     app.dependency_overrides.clear()
 
     assert response.status_code == 200
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "success"
     assert data["event_id"] == "550e8400-e29b-41d4-a716-446655440000"
     assert data["event_type"] == "user.signup"
@@ -71,7 +71,6 @@ async def test_get_event_success(mock_api_key, mock_event_response):
     assert data["delivered"] is False
 
 
-@pytest.mark.asyncio
 async def test_get_event_not_found(mock_api_key):
     """Test event not found returns 404."""
 
@@ -95,13 +94,12 @@ async def test_get_event_not_found(mock_api_key):
     app.dependency_overrides.clear()
 
     assert response.status_code == 404
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "NOT_FOUND"
     assert "nonexistent-id" in data["message"]
 
 
-@pytest.mark.asyncio
 async def test_get_event_unauthorized():
     """Test GET without API key returns 401."""
     transport = ASGITransport(app=app)
@@ -112,12 +110,11 @@ async def test_get_event_unauthorized():
         )
 
     assert response.status_code == 401
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "UNAUTHORIZED"
 
 
-@pytest.mark.asyncio
 async def test_get_event_missing_timestamp(mock_api_key):
     """Test GET without timestamp parameter returns 400."""
 
@@ -138,7 +135,6 @@ async def test_get_event_missing_timestamp(mock_api_key):
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_get_event_delivered(mock_api_key):
     """Test retrieving a delivered event."""
     delivered_event = EventResponse(
@@ -172,5 +168,5 @@ async def test_get_event_delivered(mock_api_key):
     app.dependency_overrides.clear()
 
     assert response.status_code == 200
-    data = response.json()
+    data = response_json(response)
     assert data["delivered"] is True
@@ -10,6 +10,8 @@ from src.auth.api_key import hash_api_key
 from src.main import app
 from src.models.api_key import ApiKey
 from src.models.event import Event
+from src.utils.cursor import decode_cursor, encode_cursor
+from tests.helpers import response_json
 
 
 @pytest.fixture
@@ -66,12 +68,12 @@ def sample_events():
     ]
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_success(valid_api_key, mock_api_key_model, sample_events):
+async def test_get_inbox_success(
+    valid_api_key, mock_api_key_model, sample_events, mock_event_repository
+):
     """Test successful retrieval of inbox events."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -80,9 +82,8 @@ async def test_get_inbox_success(valid_api_key, mock_api_key_model, sample_event
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = True
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=(sample_events, None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -93,7 +94,7 @@ async def test_get_inbox_success(valid_api_key, mock_api_key_model, sample_event
             )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert "events" in data
         assert "pagination" in data
         assert len(data["events"]) == 3
@@ -103,12 +104,12 @@ async def test_get_inbox_success(valid_api_key, mock_api_key_model, sample_event
         assert data["pagination"]["next_cursor"] is None
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_with_limit(valid_api_key, mock_api_key_model, sample_events):
+async def test_get_inbox_with_limit(
+    valid_api_key, mock_api_key_model, sample_events, mock_event_repository
+):
     """Test inbox retrieval with custom limit."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -117,11 +118,16 @@ async def test_get_inbox_with_limit(valid_api_key, mock_api_key_model, sample_ev
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = True
 
-        mock_repo = AsyncMock()
+        # DeliveredIndex LastEvaluatedKey: table keys plus the index key
+        last_key = {
+            "event_id": "event-2",
+            "timestamp": "2025-11-11T12:01:00Z",
+            "delivered": 0,
+        }
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(
-            return_value=(sample_events[:2], {"event_id": "event-2"})
+            return_value=(sample_events[:2], last_key)
         )
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -132,22 +138,23 @@ async def test_get_inbox_with_limit(valid_api_key, mock_api_key_model, sample_ev
             )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert len(data["events"]) == 2
         assert data["pagination"]["has_more"] is True
-        assert data["pagination"]["next_cursor"] is not None
+        assert decode_cursor(data["pagination"]["next_cursor"]) == {
+            "event_id": "event-2",
+            "timestamp": "2025-11-11T12:01:00Z",
+        }
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_with_cursor(valid_api_key, mock_api_key_model, sample_events):
+async def test_get_inbox_with_cursor(
+    valid_api_key, mock_api_key_model, sample_events, mock_event_repository
+):
     """Test inbox pagination with cursor."""
-    import json
-
-    cursor = json.dumps({"event_id": "event-2"})
+    cursor = encode_cursor({"event_id": "event-2", "timestamp": "2025-11-11T12:01:00Z"})
 
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -156,9 +163,8 @@ async def test_get_inbox_with_cursor(valid_api_key, mock_api_key_model, sample_e
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = True
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([sample_events[2]], None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -169,20 +175,18 @@ async def test_get_inbox_with_cursor(valid_api_key, mock_api_key_model, sample_e
             )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert len(data["events"]) == 1
         assert data["events"][0]["event_id"] == "event-3"
         assert data["pagination"]["has_more"] is False
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_empty():
+async def test_get_inbox_empty(mock_event_repository):
     """Test inbox retrieval when no events exist."""
     valid_api_key = "test_api_key_12345678901234567890123456789012"
 
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -198,9 +202,8 @@ async def test_get_inbox_empty():
         mock_verify.return_value = mock_api_key
         mock_rate_limit.return_value = True
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([], None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -211,14 +214,13 @@ async def test_get_inbox_empty():
             )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert data["events"] == []
         assert data["pagination"]["has_more"] is False
         assert data["pagination"]["next_cursor"] is None
         assert data["pagination"]["total_undelivered"] == 0
 
 
-@pytest.mark.asyncio
 async def test_get_inbox_missing_auth():
     """Test inbox retrieval without authentication."""
     async with AsyncClient(
@@ -227,12 +229,11 @@ async def test_get_inbox_missing_auth():
         response = await client.get("/events/inbox")
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "UNAUTHORIZED"
 
 
-@pytest.mark.asyncio
 async def test_get_inbox_invalid_api_key():
     """Test inbox retrieval with invalid API key."""
     invalid_key = "invalid_key_123"
@@ -251,7 +252,6 @@ async def test_get_inbox_invalid_api_key():
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-@pytest.mark.asyncio
 async def test_get_inbox_rate_limit_exceeded(valid_api_key, mock_api_key_model):
     """Test inbox retrieval when rate limit is exceeded."""
     with (
@@ -277,19 +277,17 @@ async def test_get_inbox_rate_limit_exceeded(valid_api_key, mock_api_key_model):
             )
 
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-        data = response.json()
+        data = response_json(response)
         assert data["status"] == "error"
         assert data["error_code"] == "RATE_LIMIT_EXCEEDED"
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_limit_validation():
+async def test_get_inbox_limit_validation(mock_event_repository):
     """Test inbox limit parameter validation."""
     valid_api_key = "test_api_key_12345678901234567890123456789012"
 
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -305,9 +303,8 @@ async def test_get_inbox_limit_validation():
         mock_verify.return_value = mock_api_key
         mock_rate_limit.return_value = True
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([], None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -341,12 +338,12 @@ async def test_get_inbox_limit_validation():
             assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
-@pytest.mark.asyncio
-async def test_get_inbox_invalid_cursor(valid_api_key, mock_api_key_model):
+async def test_get_inbox_invalid_cursor(
+    valid_api_key, mock_api_key_model, mock_event_repository
+):
     """Test inbox with invalid cursor (should start from beginning)."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -355,9 +352,8 @@ async def test_get_inbox_invalid_cursor(valid_api_key, mock_api_key_model):
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = True
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.list_undelivered = AsyncMock(return_value=([], None))
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -369,5 +365,5 @@ async def test_get_inbox_invalid_cursor(valid_api_key, mock_api_key_model):
 
         # Should succeed but start from beginning
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert "events" in data
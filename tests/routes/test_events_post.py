@@ -9,6 +9,7 @@ from httpx import ASGITransport, AsyncClient
 from src.auth.api_key import hash_api_key
 from src.main import app
 from src.models.api_key import ApiKey
+from tests.helpers import response_json
 
 
 @pytest.fixture
@@ -40,14 +41,12 @@ def valid_event_request():
     }
 
 
-@pytest.mark.asyncio
 async def test_create_event_success(
-    valid_api_key, mock_api_key_model, valid_event_request
+    valid_api_key, mock_api_key_model, valid_event_request, mock_event_repository
 ):
     """Test successful event creation."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
@@ -56,9 +55,8 @@ async def test_create_event_success(
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
 
-        mock_repo = AsyncMock()
+        mock_repo = mock_event_repository
         mock_repo.create = AsyncMock(return_value=None)
-        mock_repo_class.return_value = mock_repo
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -70,14 +68,13 @@ async def test_create_event_success(
             )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert data["status"] == "accepted"
         assert "event_id" in data
         assert "timestamp" in data
         assert data["message"] == "Event successfully ingested"
 
 
-@pytest.mark.asyncio
 async def test_create_event_missing_auth():
     """Test event creation without authentication header."""
     valid_event_request = {
@@ -91,12 +88,11 @@ async def test_create_event_missing_auth():
         response = await client.post("/events", json=valid_event_request)
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "UNAUTHORIZED"
 
 
-@pytest.mark.asyncio
 async def test_create_event_invalid_api_key():
     """Test event creation with invalid API key."""
     valid_event_request = {
@@ -117,12 +113,11 @@ async def test_create_event_invalid_api_key():
             )
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "UNAUTHORIZED"
 
 
-@pytest.mark.asyncio
 async def test_create_event_revoked_key(valid_api_key, mock_api_key_model):
     """Test event creation with revoked API key."""
     revoked_key = ApiKey(**{**mock_api_key_model.model_dump(), "status": "revoked"})
@@ -145,12 +140,11 @@ async def test_create_event_revoked_key(valid_api_key, mock_api_key_model):
             )
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "FORBIDDEN"
 
 
-@pytest.mark.asyncio
 async def test_create_event_missing_required_field(valid_api_key, mock_api_key_model):
     """Test event creation with missing required field."""
     invalid_request = {
@@ -177,13 +171,12 @@ async def test_create_event_missing_required_field(valid_api_key, mock_api_key_m
             )
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "VALIDATION_ERROR"
     assert "validation_errors" in data["details"]
 
 
-@pytest.mark.asyncio
 async def test_create_event_empty_event_type(valid_api_key, mock_api_key_model):
     """Test event creation with empty event_type."""
     invalid_request = {
@@ -210,12 +203,11 @@ async def test_create_event_empty_event_type(valid_api_key, mock_api_key_model):
             )
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "VALIDATION_ERROR"
 
 
-@pytest.mark.asyncio
 async def test_create_event_oversized_payload(valid_api_key, mock_api_key_model):
     """Test event creation with oversized payload (> 256KB)."""
     # Create payload > 256KB
@@ -244,12 +236,11 @@ async def test_create_event_oversized_payload(valid_api_key, mock_api_key_model)
             )
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "VALIDATION_ERROR"
 
 
-@pytest.mark.asyncio
 async def test_create_event_rate_limit_exceeded(
     valid_api_key, mock_api_key_model, valid_event_request
 ):
@@ -277,32 +268,31 @@ async def test_create_event_rate_limit_exceeded(
             )
 
     assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
-    data = response.json()
+    data = response_json(response)
     assert data["status"] == "error"
     assert data["error_code"] == "RATE_LIMIT_EXCEEDED"
     assert "Retry-After" in response.headers
 
 
-@pytest.mark.asyncio
 async def test_create_event_duplicate_detection(
-    valid_api_key, mock_api_key_model, valid_event_request
+    valid_api_key, mock_api_key_model, valid_event_request, mock_event_repository
 ):
     """Test duplicate event detection returns same event ID."""
     with (
         patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
-        patch("src.services.event_service.EventRepository") as mock_repo_class,
         patch(
             "src.middleware.rate_limit.rate_limiter.check_rate_limit"
         ) as mock_rate_limit,
-        patch("src.utils.deduplication.DeduplicationCache.check_and_add") as mock_dedup,
+        patch(
+            "src.utils.deduplication.DeduplicationCache.check_and_add_encoded"
+        ) as mock_dedup,
     ):
         # Setup mocks
         mock_verify.return_value = mock_api_key_model
         mock_rate_limit.return_value = None
         mock_dedup.return_value = "existing-event-id-123"  # Duplicate detected
 
-        mock_repo = AsyncMock()
-        mock_repo_class.return_value = mock_repo
+        mock_repo = mock_event_repository
 
         async with AsyncClient(
             transport=ASGITransport(app=app), base_url="http://test"
@@ -314,7 +304,7 @@ async def test_create_event_duplicate_detection(
             )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response_json(response)
         assert data["status"] == "accepted"
         assert data["event_id"] == "existing-event-id-123"
         assert "duplicate detected" in data["message"].lower()
@@ -323,7 +313,37 @@ async def test_create_event_duplicate_detection(
         mock_repo.create.assert_not_called()
 
 
-@pytest.mark.asyncio
+async def test_create_event_repeated_post_returns_same_event_id(
+    valid_api_key, mock_api_key_model, valid_event_request, mock_event_repository
+):
+    """Test the dedup cache is shared across requests."""
+    with (
+        patch("src.auth.dependencies.verify_key_against_all") as mock_verify,
+        patch(
+            "src.middleware.rate_limit.rate_limiter.check_rate_limit"
+        ) as mock_rate_limit,
+    ):
+        mock_verify.return_value = mock_api_key_model
+        mock_rate_limit.return_value = None
+        mock_event_repository.create = AsyncMock(return_value=None)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first, second = [
+                await client.post(
+                    "/events",
+                    json=valid_event_request,
+                    headers={"Authorization": f"Bearer {valid_api_key}"},
+                )
+                for _ in range(2)
+            ]
+
+        assert response_json(second)["event_id"] == response_json(first)["event_id"]
+        assert "duplicate detected" in response_json(second)["message"].lower()
+        mock_event_repository.create.assert_awaited_once()
+
+
 async def test_create_event_malformed_json():
     """Test event creation with malformed JSON."""
     async with AsyncClient(
@@ -7,9 +7,9 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from src.main import app
+from tests.helpers import response_json
 
 
-@pytest.mark.asyncio
 async def test_status_endpoint_returns_200() -> None:
     """Test that status endpoint returns 200 OK."""
     async with AsyncClient(
@@ -20,7 +20,6 @@ async def test_status_endpoint_returns_200() -> None:
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_status_endpoint_returns_json() -> None:
     """Test that status endpoint returns JSON."""
     async with AsyncClient(
@@ -31,7 +30,6 @@ async def test_status_endpoint_returns_json() -> None:
     assert response.headers["content-type"] == "application/json"
 
 
-@pytest.mark.asyncio
 async def test_status_endpoint_has_required_fields() -> None:
     """Test that status endpoint response has required fields."""
     async with AsyncClient(
@@ -39,7 +37,7 @@ async def test_status_endpoint_has_required_fields() -> None:
     ) as client:
         response = await client.get("/status")
 
-    data: dict[str, Any] = response.json()
+    data: dict[str, Any] = response_json(response)
 
     # Required fields
     assert "status" in data
@@ -47,7 +45,6 @@ async def test_status_endpoint_has_required_fields() -> None:
     assert "uptime_seconds" in data
 
 
-@pytest.mark.asyncio
 async def test_status_field_is_ok() -> None:
     """Test that status field is 'ok'."""
     async with AsyncClient(
@@ -55,11 +52,10 @@ async def test_status_field_is_ok() -> None:
     ) as client:
         response = await client.get("/status")
 
-    data: dict[str, Any] = response.json()
+    data: dict[str, Any] = response_json(response)
     assert data["status"] == "ok"
 
 
-@pytest.mark.asyncio
 async def test_version_field_is_string() -> None:
     """Test that version field is a non-empty string."""
     async with AsyncClient(
@@ -67,12 +63,11 @@ async def test_version_field_is_string() -> None:
     ) as client:
         response = await client.get("/status")
 
-    data: dict[str, Any] = response.json()
+    data: dict[str, Any] = response_json(response)
     assert isinstance(data["version"], str)
     assert len(data["version"]) > 0
 
 
-@pytest.mark.asyncio
 async def test_uptime_is_integer() -> None:
     """Test that uptime_seconds is an integer."""
     async with AsyncClient(
@@ -80,11 +75,10 @@ async def test_uptime_is_integer() -> None:
     ) as client:
         response = await client.get("/status")
 
-    data: dict[str, Any] = response.json()
+    data: dict[str, Any] = response_json(response)
     assert isinstance(data["uptime_seconds"], int)
 
 
-@pytest.mark.asyncio
 async def test_uptime_is_non_negative() -> None:
     """Test that uptime_seconds is non-negative."""
     async with AsyncClient(
@@ -92,32 +86,31 @@ async def test_uptime_is_non_negative() -> None:
     ) as client:
         response = await client.get("/status")
 
-    data: dict[str, Any] = response.json()
+    data: dict[str, Any] = response_json(response)
     assert data["uptime_seconds"] >= 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
 async def test_uptime_increases_over_time() -> None:
     """Test that uptime_seconds increases on subsequent calls."""
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
     ) as client:
         response1 = await client.get("/status")
-        data1: dict[str, Any] = response1.json()
+        data1: dict[str, Any] = response_json(response1)
         uptime1: int = data1["uptime_seconds"]
 
         # Wait a moment
         time.sleep(1.1)
 
         response2 = await client.get("/status")
-        data2: dict[str, Any] = response2.json()
+        data2: dict[str, Any] = response_json(response2)
         uptime2: int = data2["uptime_seconds"]
 
     # Uptime should increase by at least 1 second
     assert uptime2 >= uptime1 + 1
 
 
-@pytest.mark.asyncio
 async def test_status_endpoint_no_authentication_required() -> None:
     """Test that status endpoint does not require authentication."""
     # Request without Authorization header should succeed
@@ -129,7 +122,6 @@ async def test_status_endpoint_no_authentication_required() -> None:
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_status_endpoint_response_time() -> None:
     """Test that status endpoint responds quickly (< 100ms)."""
     async with AsyncClient(
@@ -146,7 +138,6 @@ async def test_status_endpoint_response_time() -> None:
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
 async def test_status_endpoint_multiple_calls() -> None:
     """Test that status endpoint can be called multiple times."""
     async with AsyncClient(
@@ -155,5 +146,5 @@ async def test_status_endpoint_multiple_calls() -> None:
         for _ in range(5):
             response = await client.get("/status")
             assert response.status_code == 200
-            data: dict[str, Any] = response.json()
+            data: dict[str, Any] = response_json(response)
             assert data["status"] == "ok"
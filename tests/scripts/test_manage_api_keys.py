@@ -1,7 +1,10 @@
 """Tests for API key management CLI."""
 
+import string
 import uuid
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -15,396 +18,317 @@ from scripts.manage_api_keys import (
 )
 from src.models.api_key import ApiKey
 
+# Deterministic key IDs; tests only need well-formed, distinct UUID strings
+KEY_ID_POOL = [str(uuid.UUID(int=i)) for i in range(1, 32)]
+
+# URL-safe base64 alphabet: alphanumerics plus - and _
+_ALLOWED = frozenset(string.ascii_letters + string.digits + "-_")
+
+
+@pytest.fixture(scope="module")
+def api_key_factory() -> Callable[..., ApiKey]:
+    """
+    Build ApiKey models with shared defaults.
+
+    The created_at timestamp is computed once per module; any field can be
+    overridden per call.
+    """
+    created_at = datetime.now(UTC).isoformat()
+
+    def make(status: str = "active", **overrides: Any) -> ApiKey:
+        fields: dict[str, Any] = {
+            "key_id": KEY_ID_POOL[0],
+            "key_hash": "hash",
+            "status": status,
+            "rate_limit": 100,
+            "created_at": created_at,
+        }
+        fields.update(overrides)
+        return ApiKey(**fields)
+
+    return make
+
+
+@pytest.fixture(scope="module")
+def dynamo_mocks() -> tuple[MagicMock, MagicMock]:
+    """
+    Build the aioboto3 session/resource/table mock chain once per module.
+
+    Returns:
+        Tuple of (mock_table, mock_repo); mock_repo.session.resource(...)
+        yields a DynamoDB resource whose Table() returns mock_table.
+    """
+    mock_table = MagicMock()
+    mock_table.scan = AsyncMock()
+    mock_table.update_item = AsyncMock()
+
+    mock_dynamodb = MagicMock()
+    mock_dynamodb.Table = AsyncMock(return_value=mock_table)
+
+    mock_session = MagicMock()
+    resource_ctx = mock_session.resource.return_value
+    resource_ctx.__aenter__ = AsyncMock(return_value=mock_dynamodb)
+    resource_ctx.__aexit__ = AsyncMock(return_value=None)
+
+    mock_repo = MagicMock()
+    mock_repo.session = mock_session
+    mock_repo.create = AsyncMock()
+    mock_repo.get_by_id = AsyncMock()
+    return mock_table, mock_repo
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_api_key_repository(
+    dynamo_mocks: tuple[MagicMock, MagicMock],
+) -> Iterator[MagicMock]:
+    """Make ApiKeyRepository() in the CLI return the shared mock for the module."""
+    _, mock_repo = dynamo_mocks
+    patcher = patch("scripts.manage_api_keys.ApiKeyRepository", return_value=mock_repo)
+    patcher.start()
+    yield mock_repo
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def _reset_dynamo_mocks(dynamo_mocks: tuple[MagicMock, MagicMock]) -> Iterator[None]:
+    """Clear calls and per-test return values on the shared DynamoDB mocks."""
+    yield
+    mock_table, mock_repo = dynamo_mocks
+    mock_table.reset_mock(return_value=True, side_effect=True)
+    mock_repo.reset_mock()
+    mock_repo.create.reset_mock(return_value=True, side_effect=True)
+    mock_repo.get_by_id.reset_mock(return_value=True, side_effect=True)
+
 
 class TestGenerateApiKey:
     """Tests for generate_api_key function."""
 
-    def test_generates_64_char_string(self) -> None:
-        """Test that API key is 64 characters long."""
-        key = generate_api_key()
-        assert len(key) == 64
-
-    def test_generates_alphanumeric(self) -> None:
-        """Test that API key contains only alphanumeric chars."""
-        key = generate_api_key()
-        # URL-safe base64 uses alphanumeric + - and _
-        assert all(c.isalnum() or c in ["-", "_"] for c in key)
-
-    def test_generates_unique_keys(self) -> None:
-        """Test that consecutive calls generate different keys."""
+    def test_generate_api_key_properties(self) -> None:
+        """Test key length, URL-safe alphabet and uniqueness across calls."""
         key1 = generate_api_key()
         key2 = generate_api_key()
+
+        assert len(key1) == 64
+        assert set(key1) <= _ALLOWED
         assert key1 != key2
 
 
 class TestCmdGenerate:
     """Tests for cmd_generate command."""
 
-    @pytest.mark.asyncio
-    async def test_generate_creates_key(self) -> None:
+    async def test_generate_creates_key(
+        self,
+        dynamo_mocks: tuple[MagicMock, MagicMock],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Test that generate command creates a key."""
-        mock_repo = MagicMock()
-        mock_repo.create = AsyncMock()
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-        ):
-            await cmd_generate(
-                description="Test key",
-                rate_limit=100,
-                allowed_event_types=None,
-            )
-
-            # Verify create was called once
-            assert mock_repo.create.call_count == 1
-
-            # Verify the ApiKey passed to create
-            created_key = mock_repo.create.call_args[0][0]
-            assert isinstance(created_key, ApiKey)
-            assert created_key.status == "active"
-            assert created_key.rate_limit == 100
-            assert created_key.description == "Test key"
-            assert created_key.allowed_event_types is None
-
-            # Verify output
-            assert mock_print.call_count > 0
-
-    @pytest.mark.asyncio
-    async def test_generate_with_event_types(self) -> None:
+        _, mock_repo = dynamo_mocks
+
+        await cmd_generate(
+            description="Test key",
+            rate_limit=100,
+            allowed_event_types=None,
+        )
+
+        # Verify create was called once
+        assert mock_repo.create.call_count == 1
+
+        # Verify the ApiKey passed to create
+        created_key = mock_repo.create.call_args[0][0]
+        assert isinstance(created_key, ApiKey)
+        assert created_key.status == "active"
+        assert created_key.rate_limit == 100
+        assert created_key.description == "Test key"
+        assert created_key.allowed_event_types is None
+
+        # Verify output
+        assert capsys.readouterr().out
+
+    async def test_generate_with_event_types(
+        self, dynamo_mocks: tuple[MagicMock, MagicMock]
+    ) -> None:
         """Test generate with allowed event types."""
-        mock_repo = MagicMock()
-        mock_repo.create = AsyncMock()
-
-        with patch(
-            "scripts.manage_api_keys.ApiKeyRepository",
-            return_value=mock_repo,
-        ):
-            await cmd_generate(
-                description="Test key",
-                rate_limit=200,
-                allowed_event_types=["order.created", "order.updated"],
-            )
-
-            created_key = mock_repo.create.call_args[0][0]
-            assert created_key.allowed_event_types == [
-                "order.created",
-                "order.updated",
-            ]
-            assert created_key.rate_limit == 200
-
-    @pytest.mark.asyncio
-    async def test_generate_prints_key_once(self) -> None:
+        _, mock_repo = dynamo_mocks
+
+        await cmd_generate(
+            description="Test key",
+            rate_limit=200,
+            allowed_event_types=["order.created", "order.updated"],
+        )
+
+        created_key = mock_repo.create.call_args[0][0]
+        assert created_key.allowed_event_types == [
+            "order.created",
+            "order.updated",
+        ]
+        assert created_key.rate_limit == 200
+
+    async def test_generate_prints_key_once(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test that API key is printed exactly once."""
-        mock_repo = MagicMock()
-        mock_repo.create = AsyncMock()
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-        ):
-            await cmd_generate(
-                description="Test",
-                rate_limit=100,
-                allowed_event_types=None,
-            )
-
-            # Count how many times "API Key:" appears in print calls
-            api_key_prints = [
-                call for call in mock_print.call_args_list if "API Key:" in str(call)
-            ]
-            assert len(api_key_prints) == 1
+        await cmd_generate(
+            description="Test",
+            rate_limit=100,
+            allowed_event_types=None,
+        )
+
+        # "API Key:" must appear exactly once in the output
+        assert capsys.readouterr().out.count("API Key:") == 1
 
 
 class TestCmdList:
     """Tests for cmd_list command."""
 
-    @pytest.mark.asyncio
-    async def test_list_empty(self) -> None:
+    async def test_list_empty(
+        self,
+        dynamo_mocks: tuple[MagicMock, MagicMock],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Test list with no keys."""
-        mock_table = MagicMock()
-        mock_table.scan = AsyncMock(return_value={"Items": []})
+        mock_table, _ = dynamo_mocks
+        mock_table.scan.return_value = {"Items": []}
 
-        mock_dynamodb = MagicMock()
-        mock_dynamodb.Table = AsyncMock(return_value=mock_table)
+        await cmd_list()
 
-        mock_session = MagicMock()
-        mock_session.resource = MagicMock()
-        mock_session.resource.return_value.__aenter__ = AsyncMock(
-            return_value=mock_dynamodb
-        )
-        mock_session.resource.return_value.__aexit__ = AsyncMock()
-
-        mock_repo = MagicMock()
-        mock_repo.session = mock_session
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-        ):
-            await cmd_list()
-
-            # Verify message for empty list
-            printed_text = " ".join(
-                str(call[0][0]) for call in mock_print.call_args_list
-            )
-            assert "No API keys found" in printed_text
-
-    @pytest.mark.asyncio
-    async def test_list_with_keys(self) -> None:
+        # Verify message for empty list
+        printed_text = capsys.readouterr().out
+        assert "No API keys found" in printed_text
+
+    async def test_list_with_keys(
+        self,
+        api_key_factory: Callable[..., ApiKey],
+        dynamo_mocks: tuple[MagicMock, MagicMock],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Test list with multiple keys."""
-        key1 = ApiKey(
-            key_id=str(uuid.uuid4()),
-            key_hash="hash1",
-            status="active",
-            rate_limit=100,
-            created_at=datetime.now(UTC).isoformat(),
-            description="Key 1",
+        key1 = api_key_factory(
+            key_id=KEY_ID_POOL[1], key_hash="hash1", description="Key 1"
         )
-        key2 = ApiKey(
-            key_id=str(uuid.uuid4()),
-            key_hash="hash2",
+        key2 = api_key_factory(
+            key_id=KEY_ID_POOL[2],
             status="revoked",
+            key_hash="hash2",
             rate_limit=200,
-            created_at=datetime.now(UTC).isoformat(),
             description="Key 2",
         )
 
-        mock_table = MagicMock()
-        mock_table.scan = AsyncMock(
-            return_value={"Items": [key1.model_dump(), key2.model_dump()]}
-        )
-
-        mock_dynamodb = MagicMock()
-        mock_dynamodb.Table = AsyncMock(return_value=mock_table)
-
-        mock_session = MagicMock()
-        mock_session.resource = MagicMock()
-        mock_session.resource.return_value.__aenter__ = AsyncMock(
-            return_value=mock_dynamodb
-        )
-        mock_session.resource.return_value.__aexit__ = AsyncMock()
-
-        mock_repo = MagicMock()
-        mock_repo.session = mock_session
+        mock_table, _ = dynamo_mocks
+        mock_table.scan.return_value = {"Items": [key1.model_dump(), key2.model_dump()]}
 
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-        ):
-            await cmd_list()
+        await cmd_list()
 
-            # Verify total count printed
-            printed_text = " ".join(
-                str(call[0][0]) for call in mock_print.call_args_list
-            )
-            assert "Total: 2 API keys" in printed_text
+        # Verify total count printed
+        printed_text = capsys.readouterr().out
+        assert "Total: 2 API keys" in printed_text
 
 
 class TestCmdRevoke:
     """Tests for cmd_revoke command."""
 
-    @pytest.mark.asyncio
-    async def test_revoke_existing_key(self) -> None:
+    async def test_revoke_existing_key(
+        self,
+        api_key_factory: Callable[..., ApiKey],
+        dynamo_mocks: tuple[MagicMock, MagicMock],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Test revoking an active key."""
-        key_id = str(uuid.uuid4())
-        api_key = ApiKey(
-            key_id=key_id,
-            key_hash="hash",
-            status="active",
-            rate_limit=100,
-            created_at=datetime.now(UTC).isoformat(),
-        )
+        key_id = KEY_ID_POOL[3]
+        api_key = api_key_factory(key_id=key_id)
 
-        mock_table = MagicMock()
-        mock_table.update_item = AsyncMock()
+        mock_table, mock_repo = dynamo_mocks
+        mock_repo.get_by_id.return_value = api_key
 
-        mock_dynamodb = MagicMock()
-        mock_dynamodb.Table = AsyncMock(return_value=mock_table)
+        await cmd_revoke(key_id)
 
-        mock_session = MagicMock()
-        mock_session.resource = MagicMock()
-        mock_session.resource.return_value.__aenter__ = AsyncMock(
-            return_value=mock_dynamodb
-        )
-        mock_session.resource.return_value.__aexit__ = AsyncMock()
-
-        mock_repo = MagicMock()
-        mock_repo.session = mock_session
-        mock_repo.get_by_id = AsyncMock(return_value=api_key)
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-        ):
-            await cmd_revoke(key_id)
-
-            # Verify update_item was called
-            assert mock_table.update_item.call_count == 1
-            update_args = mock_table.update_item.call_args
-
-            # Verify correct key and status
-            assert update_args[1]["Key"]["key_id"] == key_id
-            assert update_args[1]["ExpressionAttributeValues"][":status"] == "revoked"
-
-            # Verify success message
-            printed_text = " ".join(
-                str(call[0][0]) for call in mock_print.call_args_list
-            )
-            assert "revoked" in printed_text.lower()
-
-    @pytest.mark.asyncio
-    async def test_revoke_already_revoked(self) -> None:
+        # Verify update_item was called
+        assert mock_table.update_item.call_count == 1
+        update_args = mock_table.update_item.call_args
+
+        # Verify correct key and status
+        assert update_args[1]["Key"]["key_id"] == key_id
+        assert update_args[1]["ExpressionAttributeValues"][":status"] == "revoked"
+
+        # Verify success message
+        printed_text = capsys.readouterr().out
+        assert "revoked" in printed_text.lower()
+
+    async def test_revoke_already_revoked(
+        self,
+        api_key_factory: Callable[..., ApiKey],
+        dynamo_mocks: tuple[MagicMock, MagicMock],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Test revoking an already revoked key."""
-        key_id = str(uuid.uuid4())
-        api_key = ApiKey(
-            key_id=key_id,
-            key_hash="hash",
-            status="revoked",
-            rate_limit=100,
-            created_at=datetime.now(UTC).isoformat(),
-        )
+        key_id = KEY_ID_POOL[4]
+        api_key = api_key_factory(status="revoked", key_id=key_id)
 
-        mock_repo = MagicMock()
-        mock_repo.get_by_id = AsyncMock(return_value=api_key)
-        mock_repo.session = MagicMock()
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-        ):
-            await cmd_revoke(key_id)
-
-            # Verify warning message
-            printed_text = " ".join(
-                str(call[0][0]) for call in mock_print.call_args_list
-            )
-            assert "already revoked" in printed_text.lower()
-
-    @pytest.mark.asyncio
-    async def test_revoke_nonexistent_key(self) -> None:
-        """Test revoking a non-existent key."""
-        key_id = str(uuid.uuid4())
-
-        mock_repo = MagicMock()
-        mock_repo.get_by_id = AsyncMock(return_value=None)
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-            pytest.raises(SystemExit) as exc_info,
-        ):
-            await cmd_revoke(key_id)
-
-            # Verify exit code 1
-            assert exc_info.value.code == 1
-
-            # Verify error message
-            printed_text = " ".join(
-                str(call[0][0]) for call in mock_print.call_args_list
-            )
-            assert "not found" in printed_text.lower()
+        _, mock_repo = dynamo_mocks
+        mock_repo.get_by_id.return_value = api_key
+
+        await cmd_revoke(key_id)
+
+        # Verify warning message
+        printed_text = capsys.readouterr().out
+        assert "already revoked" in printed_text.lower()
 
 
 class TestCmdUpdateRateLimit:
     """Tests for cmd_update_rate_limit command."""
 
-    @pytest.mark.asyncio
-    async def test_update_rate_limit(self) -> None:
+    async def test_update_rate_limit(
+        self,
+        api_key_factory: Callable[..., ApiKey],
+        dynamo_mocks: tuple[MagicMock, MagicMock],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Test updating rate limit for a key."""
-        key_id = str(uuid.uuid4())
-        api_key = ApiKey(
-            key_id=key_id,
-            key_hash="hash",
-            status="active",
-            rate_limit=100,
-            created_at=datetime.now(UTC).isoformat(),
-        )
-
-        mock_table = MagicMock()
-        mock_table.update_item = AsyncMock()
-
-        mock_dynamodb = MagicMock()
-        mock_dynamodb.Table = AsyncMock(return_value=mock_table)
-
-        mock_session = MagicMock()
-        mock_session.resource = MagicMock()
-        mock_session.resource.return_value.__aenter__ = AsyncMock(
-            return_value=mock_dynamodb
-        )
-        mock_session.resource.return_value.__aexit__ = AsyncMock()
-
-        mock_repo = MagicMock()
-        mock_repo.session = mock_session
-        mock_repo.get_by_id = AsyncMock(return_value=api_key)
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-        ):
-            await cmd_update_rate_limit(key_id, 500)
-
-            # Verify update_item was called
-            assert mock_table.update_item.call_count == 1
-            update_args = mock_table.update_item.call_args
-
-            # Verify correct key and rate_limit
-            assert update_args[1]["Key"]["key_id"] == key_id
-            assert update_args[1]["ExpressionAttributeValues"][":rate_limit"] == 500
-
-            # Verify success message with new rate limit
-            printed_text = " ".join(
-                str(call[0][0]) for call in mock_print.call_args_list
-            )
-            assert "500" in printed_text
-
-    @pytest.mark.asyncio
-    async def test_update_rate_limit_nonexistent_key(self) -> None:
-        """Test updating rate limit for non-existent key."""
-        key_id = str(uuid.uuid4())
-
-        mock_repo = MagicMock()
-        mock_repo.get_by_id = AsyncMock(return_value=None)
-
-        with (
-            patch(
-                "scripts.manage_api_keys.ApiKeyRepository",
-                return_value=mock_repo,
-            ),
-            patch("builtins.print") as mock_print,
-            pytest.raises(SystemExit) as exc_info,
-        ):
-            await cmd_update_rate_limit(key_id, 500)
-
-            # Verify exit code 1
-            assert exc_info.value.code == 1
-
-            # Verify error message
-            printed_text = " ".join(
-                str(call[0][0]) for call in mock_print.call_args_list
-            )
-            assert "not found" in printed_text.lower()
+        key_id = KEY_ID_POOL[6]
+        api_key = api_key_factory(key_id=key_id)
+
+        mock_table, mock_repo = dynamo_mocks
+        mock_repo.get_by_id.return_value = api_key
+
+        await cmd_update_rate_limit(key_id, 500)
+
+        # Verify update_item was called
+        assert mock_table.update_item.call_count == 1
+        update_args = mock_table.update_item.call_args
+
+        # Verify correct key and rate_limit
+        assert update_args[1]["Key"]["key_id"] == key_id
+        assert update_args[1]["ExpressionAttributeValues"][":rate_limit"] == 500
+
+        # Verify success message with new rate limit
+        printed_text = capsys.readouterr().out
+        assert "500" in printed_text
+
+
+class TestNonexistentKey:
+    """Tests for commands targeting a key that does not exist."""
+
+    @pytest.mark.parametrize(
+        ("cmd", "args"),
+        [
+            (cmd_revoke, (KEY_ID_POOL[5],)),
+            (cmd_update_rate_limit, (KEY_ID_POOL[7], 500)),
+        ],
+        ids=["revoke", "update_rate_limit"],
+    )
+    async def test_nonexistent_key_exits(
+        self,
+        cmd: Callable[..., Awaitable[None]],
+        args: tuple[Any, ...],
+        dynamo_mocks: tuple[MagicMock, MagicMock],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that the command exits with code 1 and reports the key missing."""
+        mock_table, mock_repo = dynamo_mocks
+        mock_repo.get_by_id.return_value = None
+
+        with pytest.raises(SystemExit) as exc_info:
+            await cmd(*args)
+
+        assert exc_info.value.code == 1
+        assert "not found" in capsys.readouterr().out.lower()
+        mock_table.update_item.assert_not_called()
@@ -1,53 +1,125 @@
 """Tests for EventService."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import json
+from contextlib import aclosing
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
+from pydantic import ValidationError
 
+from src.config import settings
+from src.exceptions import BatchWriteError, ServiceUnavailableError
 from src.models.event import Event
 from src.schemas.event import CreateEventRequest
-from src.services.event_service import EventService
+from src.services.event_service import EventService, get_dedup_cache
+from src.utils.cursor import decode_cursor, encode_cursor
 from src.utils.deduplication import DeduplicationCache
-
-
-@pytest.fixture
+from src.utils.serialization import encode_payload
+from tests.helpers import AsyncStub, make_event
+
+# Pagination key returned by the repository and its serialized cursor form
+_NEXT_KEY = {"event_id": "event-1", "timestamp": "2025-11-11T12:00:00Z"}
+_NEXT_CURSOR = encode_cursor(_NEXT_KEY)
+
+# Undelivered events returned for the default inbox listing
+_MOCK_EVENTS_DEFAULT = [make_event(i) for i in range(3)]
+
+# Size-limit payloads; the {"data":""} wrapper counts toward the encoded size
+_PAYLOAD_OVERHEAD = len('{"data":""}')
+_PAYLOAD_256KB = {"data": "x" * (256 * 1024 - _PAYLOAD_OVERHEAD - 1)}
+_PAYLOAD_257KB = {"data": "x" * (257 * 1024 - _PAYLOAD_OVERHEAD)}
+_PAYLOAD_255KB = {"data": "x" * (255 * 1024 - _PAYLOAD_OVERHEAD)}
+
+# Non-ASCII payloads at the limit: "é" is 2 bytes in UTF-8 (6 as a \u escape)
+_NON_ASCII_CHARS_AT_LIMIT = (256 * 1024 - _PAYLOAD_OVERHEAD) // 2
+
+# Read-only requests shared by the ingest tests (validated once at import)
+SIGNUP_REQUEST = CreateEventRequest(
+    event_type="user.signup",
+    payload={"user_id": "123", "email": "test@example.com"},
+    source="web-app",
+)
+DUPLICATE_REQUEST = CreateEventRequest(
+    event_type="user.signup",
+    payload={"user_id": "123"},
+)
+METADATA_REQUEST = CreateEventRequest(
+    event_type="order.placed",
+    payload={"order_id": "ORD-123"},
+    source="mobile-app",
+    metadata={"ip": "192.168.1.1", "user_agent": "iOS"},
+)
+
+
+@pytest.fixture(scope="module")
 def mock_repository():
-    """Create mock EventRepository."""
-    repository = AsyncMock()
-    return repository
+    """Create stub EventRepository (shared across the module)."""
+    return SimpleNamespace(
+        create=AsyncStub(),
+        batch_create=AsyncStub(),
+        get_by_id=AsyncStub(),
+        list_undelivered=AsyncStub(),
+        mark_delivered=AsyncStub(),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_dedup_cache():
-    """Create mock DeduplicationCache."""
-    cache = Mock(spec=DeduplicationCache)
-    cache.check_and_add = Mock(return_value=None)
+    """Create mock DeduplicationCache (shared across the module)."""
+    cache = Mock()
+    cache.check_and_add_encoded = Mock(return_value=None)
     return cache
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_service(mock_repository, mock_dedup_cache):
     """Create EventService with mocked dependencies."""
     return EventService(repository=mock_repository, dedup_cache=mock_dedup_cache)
 
 
-@pytest.mark.asyncio
-async def test_ingest_new_event(event_service, mock_repository):
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_repository, mock_dedup_cache):
+    """Reset shared mocks after each test so state never leaks between tests."""
+    yield
+    for stub in vars(mock_repository).values():
+        stub.reset_mock(return_value=True)
+    mock_dedup_cache.reset_mock(return_value=True, side_effect=True)
+    mock_dedup_cache.check_and_add_encoded.return_value = None
+
+
+def test_default_dedup_cache_uses_settings(mock_repository, monkeypatch):
+    """Test the default dedup cache is built from settings and shared."""
+    monkeypatch.setattr(settings, "deduplication_window_seconds", 60)
+    monkeypatch.setattr(settings, "deduplication_max_entries", 5)
+    monkeypatch.setattr(settings, "deduplication_admission_filter", True)
+    get_dedup_cache.cache_clear()
+
+    try:
+        service = EventService(repository=mock_repository)
+
+        assert service.dedup_cache.window_seconds == 60
+        assert service.dedup_cache.max_size == 5
+        assert service.dedup_cache._sketch is not None
+        assert EventService(repository=mock_repository).dedup_cache is (
+            service.dedup_cache
+        )
+    finally:
+        get_dedup_cache.cache_clear()
+
+
+async def test_ingest_new_event(mock_repository, mock_dedup_cache):
     """Test ingesting a new event."""
-    request = CreateEventRequest(
-        event_type="user.signup",
-        payload={"user_id": "123", "email": "test@example.com"},
-        source="web-app",
+    service = EventService(
+        repository=mock_repository,
+        dedup_cache=mock_dedup_cache,
+        id_factory=lambda: "test-uuid-123",
+        clock=lambda: datetime(2025, 11, 11, 12, 0, 0),
     )
 
-    with (
-        patch("src.services.event_service.uuid.uuid4") as mock_uuid,
-        patch("src.services.event_service.datetime") as mock_datetime,
-    ):
-        mock_uuid.return_value = Mock(__str__=Mock(return_value="test-uuid-123"))
-        mock_datetime.utcnow.return_value.isoformat.return_value = "2025-11-11T12:00:00"
-
-        response = await event_service.ingest(request)
+    response = await service.ingest(SIGNUP_REQUEST)
 
     assert response.status == "accepted"
     assert response.event_id == "test-uuid-123"
@@ -62,18 +134,41 @@ async def test_ingest_new_event(event_service, mock_repository):
     assert created_event.delivered is False
 
 
-@pytest.mark.asyncio
-async def test_ingest_duplicate_event(event_service, mock_repository, mock_dedup_cache):
-    """Test ingesting a duplicate event."""
-    request = CreateEventRequest(
-        event_type="user.signup",
-        payload={"user_id": "123"},
+async def test_ingest_dedups_on_cached_payload_encoding(
+    event_service, mock_dedup_cache
+):
+    """Test dedup receives the canonical bytes cached at validation."""
+    await event_service.ingest(SIGNUP_REQUEST)
+
+    mock_dedup_cache.check_and_add_encoded.assert_called_once()
+    event_type, encoded_payload, _ = (
+        mock_dedup_cache.check_and_add_encoded.call_args.args
     )
+    assert event_type == "user.signup"
+    assert encoded_payload is SIGNUP_REQUEST.encoded_payload
+    assert encoded_payload == encode_payload(SIGNUP_REQUEST.payload)
+
+
+def test_request_copy_with_new_payload_reencodes():
+    """Test a copy with an updated payload does not reuse stale bytes."""
+    copied = SIGNUP_REQUEST.model_copy(update={"payload": {"user_id": "999"}})
+
+    assert copied.encoded_payload == encode_payload({"user_id": "999"})
+    assert copied.encoded_payload != SIGNUP_REQUEST.encoded_payload
 
+
+def test_request_is_frozen():
+    """Test fields cannot be reassigned after validation."""
+    with pytest.raises(ValidationError):
+        SIGNUP_REQUEST.payload = {"user_id": "999"}
+
+
+async def test_ingest_duplicate_event(event_service, mock_repository, mock_dedup_cache):
+    """Test ingesting a duplicate event."""
     # Mock dedup cache to return existing event ID
-    mock_dedup_cache.check_and_add.return_value = "existing-uuid-456"
+    mock_dedup_cache.check_and_add_encoded.return_value = "existing-uuid-456"
 
-    response = await event_service.ingest(request)
+    response = await event_service.ingest(DUPLICATE_REQUEST)
 
     assert response.status == "accepted"
     assert response.event_id == "existing-uuid-456"
@@ -83,17 +178,9 @@ async def test_ingest_duplicate_event(event_service, mock_repository, mock_dedup
     mock_repository.create.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_ingest_with_metadata(event_service, mock_repository):
     """Test ingesting event with optional metadata."""
-    request = CreateEventRequest(
-        event_type="order.placed",
-        payload={"order_id": "ORD-123"},
-        source="mobile-app",
-        metadata={"ip": "192.168.1.1", "user_agent": "iOS"},
-    )
-
-    response = await event_service.ingest(request)
+    response = await event_service.ingest(METADATA_REQUEST)
 
     assert response.status == "accepted"
     mock_repository.create.assert_called_once()
@@ -106,7 +193,83 @@ async def test_ingest_with_metadata(event_service, mock_repository):
     }
 
 
-@pytest.mark.asyncio
+async def test_ingest_many_deduplicates_within_batch(mock_repository):
+    """Test duplicates within one batch collapse before any DB call."""
+    ids = iter(f"event-{i}" for i in range(10))
+    service = EventService(
+        repository=mock_repository,
+        dedup_cache=DeduplicationCache(window_seconds=300),
+        id_factory=lambda: next(ids),
+    )
+    requests = [
+        CreateEventRequest(event_type="order.placed", payload={"order_id": "123"})
+        for _ in range(8)
+    ] + [METADATA_REQUEST]
+
+    responses = await service.ingest_many(requests)
+
+    assert [r.event_id for r in responses] == ["event-0"] * 8 + ["event-8"]
+    assert all(r.status == "accepted" for r in responses)
+    assert "duplicate detected" in responses[1].message.lower()
+
+    # One batched write containing only the unique events
+    mock_repository.create.assert_not_called()
+    mock_repository.batch_create.assert_called_once()
+    written = mock_repository.batch_create.call_args[0][0]
+    assert [event.event_id for event in written] == ["event-0", "event-8"]
+
+
+async def test_ingest_many_forgets_fingerprints_when_write_fails():
+    """Test a failed batch write does not turn the retry into a duplicate."""
+
+    async def failing_batch_create(events):
+        raise ServiceUnavailableError(service="DynamoDB")
+
+    ids = iter(f"event-{i}" for i in range(10))
+    repository = SimpleNamespace(batch_create=failing_batch_create)
+    service = EventService(
+        repository=repository,
+        dedup_cache=DeduplicationCache(window_seconds=300),
+        id_factory=lambda: next(ids),
+    )
+
+    with pytest.raises(ServiceUnavailableError):
+        await service.ingest_many([SIGNUP_REQUEST, METADATA_REQUEST])
+
+    repository.batch_create = AsyncStub()
+    responses = await service.ingest_many([SIGNUP_REQUEST, METADATA_REQUEST])
+
+    assert [r.event_id for r in responses] == ["event-2", "event-3"]
+    assert all("duplicate" not in r.message.lower() for r in responses)
+
+
+async def test_ingest_many_keeps_fingerprints_of_written_events():
+    """Test a partial batch failure only forgets the unwritten events."""
+
+    async def partially_failing_batch_create(events):
+        raise BatchWriteError([{"event_id": events[1].event_id}])
+
+    ids = iter(f"event-{i}" for i in range(10))
+    repository = SimpleNamespace(batch_create=partially_failing_batch_create)
+    service = EventService(
+        repository=repository,
+        dedup_cache=DeduplicationCache(window_seconds=300),
+        id_factory=lambda: next(ids),
+    )
+
+    with pytest.raises(BatchWriteError):
+        await service.ingest_many([SIGNUP_REQUEST, METADATA_REQUEST])
+
+    repository.batch_create = AsyncStub()
+    responses = await service.ingest_many([SIGNUP_REQUEST, METADATA_REQUEST])
+
+    # event-0 was stored, so the retry is a duplicate; event-1 is written anew
+    assert [r.event_id for r in responses] == ["event-0", "event-3"]
+    assert "duplicate detected" in responses[0].message.lower()
+    written = repository.batch_create.call_args[0][0]
+    assert [event.event_id for event in written] == ["event-3"]
+
+
 async def test_get_existing_event(event_service, mock_repository):
     """Test retrieving an existing event."""
     mock_event = Event(
@@ -136,7 +299,6 @@ async def test_get_existing_event(event_service, mock_repository):
     )
 
 
-@pytest.mark.asyncio
 async def test_get_nonexistent_event(event_service, mock_repository):
     """Test retrieving non-existent event returns None."""
     mock_repository.get_by_id.return_value = None
@@ -146,25 +308,10 @@ async def test_get_nonexistent_event(event_service, mock_repository):
     assert response is None
 
 
-@pytest.mark.asyncio
 async def test_list_inbox_default_params(event_service, mock_repository):
     """Test listing inbox with default parameters."""
-    mock_events = [
-        Event(
-            event_id=f"event-{i}",
-            timestamp=f"2025-11-11T12:0{i}:00Z",
-            event_type="test.event",
-            payload={"index": i},
-            source=None,
-            metadata=None,
-            delivered=False,
-            created_at=f"2025-11-11T12:0{i}:00Z",
-            updated_at=f"2025-11-11T12:0{i}:00Z",
-        )
-        for i in range(3)
-    ]
     mock_repository.list_undelivered.return_value = (
-        mock_events,
+        _MOCK_EVENTS_DEFAULT,
         None,
     )
 
@@ -179,7 +326,6 @@ async def test_list_inbox_default_params(event_service, mock_repository):
     )
 
 
-@pytest.mark.asyncio
 async def test_list_inbox_with_pagination(event_service, mock_repository):
     """Test listing inbox with pagination cursor."""
     mock_events = [
@@ -195,10 +341,9 @@ async def test_list_inbox_with_pagination(event_service, mock_repository):
             updated_at="2025-11-11T12:00:00Z",
         )
     ]
-    next_key = {"event_id": "event-1", "timestamp": "2025-11-11T12:00:00Z"}
     mock_repository.list_undelivered.return_value = (
         mock_events,
-        next_key,
+        _NEXT_KEY,
     )
 
     response = await event_service.list_inbox(limit=10)
@@ -208,49 +353,88 @@ async def test_list_inbox_with_pagination(event_service, mock_repository):
     assert response.pagination.next_cursor is not None
 
     # Test using returned cursor
-    import json
+    assert response.pagination.next_cursor == _NEXT_CURSOR
+    assert decode_cursor(response.pagination.next_cursor) == _NEXT_KEY
 
-    cursor = response.pagination.next_cursor
-    decoded = json.loads(cursor)
-    assert decoded == next_key
 
+async def test_iter_inbox_prefetches_next_page(mock_dedup_cache):
+    """Test iter_inbox requests the next page while the current one streams."""
+    pages = [(_MOCK_EVENTS_DEFAULT[:2], _NEXT_KEY), (_MOCK_EVENTS_DEFAULT[2:], None)]
+    calls = []
 
-@pytest.mark.asyncio
-async def test_list_inbox_limit_clamping(event_service, mock_repository):
-    """Test inbox limit is clamped to valid range."""
-    mock_repository.list_undelivered.return_value = ([], None)
+    async def list_undelivered(limit, last_evaluated_key):
+        calls.append(last_evaluated_key)
+        await asyncio.sleep(0)
+        return pages[len(calls) - 1]
 
-    # Test limit too high
-    await event_service.list_inbox(limit=500)
-    mock_repository.list_undelivered.assert_called_with(
-        limit=200, last_evaluated_key=None
+    service = EventService(
+        repository=SimpleNamespace(list_undelivered=list_undelivered),
+        dedup_cache=mock_dedup_cache,
     )
 
-    # Test limit too low
-    await event_service.list_inbox(limit=0)
-    mock_repository.list_undelivered.assert_called_with(
-        limit=1, last_evaluated_key=None
+    seen = []
+    async with aclosing(service.iter_inbox(page_size=2)) as events:
+        async for event in events:
+            if not seen:
+                await asyncio.sleep(0)  # let the prefetch task start
+                # Second page already requested before the first is consumed
+                assert calls == [None, _NEXT_KEY]
+            seen.append(event.event_id)
+
+    assert seen == ["event-0", "event-1", "event-2"]
+    assert len(calls) == 2
+
+
+async def test_iter_inbox_early_exit_cancels_prefetch(mock_dedup_cache):
+    """Test leaving an aclosing block cancels the in-flight page query."""
+    cancelled = asyncio.Event()
+
+    async def list_undelivered(limit, last_evaluated_key):
+        if last_evaluated_key is None:
+            return _MOCK_EVENTS_DEFAULT[:2], _NEXT_KEY
+        try:
+            await asyncio.Event().wait()  # next page never arrives
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    service = EventService(
+        repository=SimpleNamespace(list_undelivered=list_undelivered),
+        dedup_cache=mock_dedup_cache,
     )
 
+    async with aclosing(service.iter_inbox(page_size=2)) as events:
+        async for _ in events:
+            await asyncio.sleep(0)  # let the prefetch task start
+            break
 
-@pytest.mark.asyncio
-async def test_list_inbox_with_cursor(event_service, mock_repository):
-    """Test listing inbox with cursor parameter."""
-    import json
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
 
-    last_key = {"event_id": "last-event", "timestamp": "2025-11-11T12:00:00Z"}
-    cursor = json.dumps(last_key)
 
+async def test_list_inbox_limit_clamping(event_service, mock_repository):
+    """Test inbox limit is clamped to valid range."""
     mock_repository.list_undelivered.return_value = ([], None)
 
-    await event_service.list_inbox(cursor=cursor)
+    # Too high clamps to the maximum, zero/negative clamp to the minimum
+    for requested, expected in [(500, 200), (0, 1), (-10, 1)]:
+        mock_repository.list_undelivered.reset_mock()
+        await event_service.list_inbox(limit=requested)
+        mock_repository.list_undelivered.assert_called_once_with(
+            limit=expected, last_evaluated_key=None
+        )
+
+
+async def test_list_inbox_with_cursor(event_service, mock_repository):
+    """Test listing inbox with cursor parameter."""
+    mock_repository.list_undelivered.return_value = ([], None)
+
+    await event_service.list_inbox(cursor=_NEXT_CURSOR)
 
     mock_repository.list_undelivered.assert_called_with(
-        limit=50, last_evaluated_key=last_key
+        limit=50, last_evaluated_key=_NEXT_KEY
     )
 
 
-@pytest.mark.asyncio
 async def test_list_inbox_invalid_cursor(event_service, mock_repository):
     """Test invalid cursor is handled gracefully."""
     mock_repository.list_undelivered.return_value = ([], None)
@@ -264,7 +448,6 @@ async def test_list_inbox_invalid_cursor(event_service, mock_repository):
     )
 
 
-@pytest.mark.asyncio
 async def test_mark_delivered_success(event_service, mock_repository):
     """Test marking event as delivered successfully."""
     mock_event = Event(
@@ -288,7 +471,6 @@ async def test_mark_delivered_success(event_service, mock_repository):
     )
 
 
-@pytest.mark.asyncio
 async def test_mark_delivered_not_found(event_service, mock_repository):
     """Test marking non-existent event returns False."""
     mock_repository.mark_delivered.return_value = None
@@ -301,7 +483,6 @@ async def test_mark_delivered_not_found(event_service, mock_repository):
 # Edge Case Tests
 
 
-@pytest.mark.asyncio
 async def test_ingest_event_type_single_char(event_service, mock_repository):
     """Test event_type with single character (minimum valid length)."""
     request = CreateEventRequest(
@@ -316,7 +497,6 @@ async def test_ingest_event_type_single_char(event_service, mock_repository):
     mock_repository.create.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_ingest_event_type_max_length(event_service, mock_repository):
     """Test event_type with exactly 255 characters (maximum valid length)."""
     request = CreateEventRequest(
@@ -335,47 +515,35 @@ async def test_ingest_event_type_max_length(event_service, mock_repository):
 
 def test_ingest_event_type_empty_raises_validation_error():
     """Test event_type with empty string raises ValidationError."""
-    from pydantic import ValidationError
-
     with pytest.raises(ValidationError) as exc_info:
         CreateEventRequest(
             event_type="",
             payload={"test": "data"},
         )
 
-    assert "event_type" in str(exc_info.value).lower()
-    assert "at least 1 character" in str(exc_info.value).lower()
+    err = str(exc_info.value).lower()
+    assert "event_type" in err
+    assert "at least 1 character" in err
 
 
 def test_ingest_event_type_too_long_raises_validation_error():
     """Test event_type with 256 characters raises ValidationError."""
-    from pydantic import ValidationError
-
     with pytest.raises(ValidationError) as exc_info:
         CreateEventRequest(
             event_type="a" * 256,
             payload={"test": "data"},
         )
 
-    assert "event_type" in str(exc_info.value).lower()
-    assert "at most 255 characters" in str(exc_info.value).lower()
+    err = str(exc_info.value).lower()
+    assert "event_type" in err
+    assert "at most 255 characters" in err
 
 
-@pytest.mark.asyncio
 async def test_ingest_payload_exactly_256kb(event_service, mock_repository):
     """Test payload at exactly 256KB (should succeed)."""
-    # Calculate size to get exactly 256KB when JSON-encoded
-    # Account for JSON structure: {"key": "value"}
-    target_size = 256 * 1024
-    # Subtract overhead for JSON structure
-    overhead = len('{"data":""}')
-    value_size = target_size - overhead - 1  # Subtract 1 more for safety
-
-    large_payload = {"data": "x" * value_size}
-
     request = CreateEventRequest(
         event_type="test.large",
-        payload=large_payload,
+        payload=_PAYLOAD_256KB,
     )
 
     response = await event_service.ingest(request)
@@ -387,44 +555,59 @@ async def test_ingest_payload_exactly_256kb(event_service, mock_repository):
 
 def test_ingest_payload_exceeds_256kb_raises_validation_error():
     """Test payload exceeding 256KB raises ValidationError."""
-    from pydantic import ValidationError
-
-    # Create payload larger than 256KB
-    target_size = 257 * 1024
-    overhead = len('{"data":""}')
-    value_size = target_size - overhead
-
-    large_payload = {"data": "x" * value_size}
-
     with pytest.raises(ValidationError) as exc_info:
         CreateEventRequest(
             event_type="test.toolarge",
-            payload=large_payload,
+            payload=_PAYLOAD_257KB,
         )
 
-    assert "payload" in str(exc_info.value).lower()
-    assert "exceeds maximum" in str(exc_info.value).lower()
+    err = str(exc_info.value).lower()
+    assert "payload" in err
+    assert "exceeds maximum" in err
 
 
-def test_ingest_payload_at_255kb_succeeds():
-    """Test payload at 255KB (should succeed)."""
-    target_size = 255 * 1024
-    overhead = len('{"data":""}')
-    value_size = target_size - overhead
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), [float("-inf")]])
+def test_payload_with_non_finite_number_raises_validation_error(value):
+    """Test NaN/Infinity are rejected rather than fingerprinted as null."""
+    with pytest.raises(ValidationError) as exc_info:
+        CreateEventRequest(event_type="test.nan", payload={"d": {"v": value}})
+
+    assert "nan or infinity" in str(exc_info.value).lower()
+
+
+def test_payload_with_null_is_accepted():
+    """Test null values still pass the non-finite number check."""
+    request = CreateEventRequest(event_type="test.null", payload={"d": None})
+
+    assert request.encoded_payload == b'{"d":null}'
+
+
+def test_payload_size_counts_non_ascii_as_utf8_bytes():
+    """Test the size limit measures UTF-8 bytes, not ASCII-escaped JSON."""
+    at_limit = {"data": "é" * _NON_ASCII_CHARS_AT_LIMIT}
+    over_limit = {"data": "é" * (_NON_ASCII_CHARS_AT_LIMIT + 1)}
+
+    request = CreateEventRequest(event_type="test.unicode", payload=at_limit)
 
-    large_payload = {"data": "x" * value_size}
+    assert len(request.encoded_payload) <= 256 * 1024
+    # The ASCII-escaped stdlib encoding would have been about 3x the limit
+    assert len(json.dumps(at_limit).encode("utf-8")) > 256 * 1024
+    with pytest.raises(ValidationError, match="exceeds maximum"):
+        CreateEventRequest(event_type="test.unicode", payload=over_limit)
 
+
+def test_ingest_payload_at_255kb_succeeds():
+    """Test payload at 255KB (should succeed)."""
     # Should not raise
     request = CreateEventRequest(
         event_type="test.large",
-        payload=large_payload,
+        payload=_PAYLOAD_255KB,
     )
 
     assert request.event_type == "test.large"
     assert len(request.payload["data"]) > 0
 
 
-@pytest.mark.asyncio
 async def test_ingest_empty_payload_succeeds(event_service, mock_repository):
     """Test ingesting event with empty payload dictionary."""
     request = CreateEventRequest(
@@ -441,7 +624,6 @@ async def test_ingest_empty_payload_succeeds(event_service, mock_repository):
     assert created_event.payload == {}
 
 
-@pytest.mark.asyncio
 async def test_ingest_complex_nested_payload(event_service, mock_repository):
     """Test ingesting event with deeply nested payload."""
     complex_payload = {
@@ -469,7 +651,6 @@ async def test_ingest_complex_nested_payload(event_service, mock_repository):
     assert created_event.payload == complex_payload
 
 
-@pytest.mark.asyncio
 async def test_list_inbox_empty(event_service, mock_repository):
     """Test listing inbox when no events exist."""
     mock_repository.list_undelivered.return_value = ([], None)
@@ -482,23 +663,9 @@ async def test_list_inbox_empty(event_service, mock_repository):
     assert response.pagination.total_undelivered == 0
 
 
-@pytest.mark.asyncio
 async def test_list_inbox_exactly_at_limit(event_service, mock_repository):
     """Test listing inbox when result count equals limit."""
-    mock_events = [
-        Event(
-            event_id=f"event-{i}",
-            timestamp=f"2025-11-11T12:{i:02d}:00Z",
-            event_type="test.event",
-            payload={"index": i},
-            source=None,
-            metadata=None,
-            delivered=False,
-            created_at=f"2025-11-11T12:{i:02d}:00Z",
-            updated_at=f"2025-11-11T12:{i:02d}:00Z",
-        )
-        for i in range(50)
-    ]
+    mock_events = [make_event(i) for i in range(50)]
     mock_repository.list_undelivered.return_value = (mock_events, None)
 
     response = await event_service.list_inbox(limit=50)
@@ -507,19 +674,16 @@ async def test_list_inbox_exactly_at_limit(event_service, mock_repository):
     assert response.pagination.has_more is False
 
 
-@pytest.mark.asyncio
 async def test_list_inbox_cursor_with_special_characters(
     event_service, mock_repository
 ):
     """Test cursor with special characters is handled properly."""
-    import json
-
     # Create cursor with special characters
     cursor_data = {
         "event_id": "test-id-with-!@#$%",
         "timestamp": "2025-11-11T12:00:00Z",
     }
-    cursor = json.dumps(cursor_data)
+    cursor = encode_cursor(cursor_data)
 
     mock_repository.list_undelivered.return_value = ([], None)
 
@@ -531,7 +695,6 @@ async def test_list_inbox_cursor_with_special_characters(
     )
 
 
-@pytest.mark.asyncio
 async def test_list_inbox_malformed_cursor_starts_from_beginning(
     event_service, mock_repository
 ):
@@ -543,6 +706,7 @@ async def test_list_inbox_malformed_cursor_starts_from_beginning(
         "not-json",
         "{invalid json",
         '{"incomplete":',
+        "bm8tc2VwYXJhdG9y",  # valid base64 without the key separator
     ]
 
     for cursor in malformed_cursors:
@@ -552,6 +716,3 @@ async def test_list_inbox_malformed_cursor_starts_from_beginning(
         mock_repository.list_undelivered.assert_called_once_with(
             limit=50, last_evaluated_key=None
         )
-
-    # Note: "null" and "123" are valid JSON and will be parsed (though may fail later)
-    # So they're not true malformed cursor tests
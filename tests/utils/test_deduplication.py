@@ -1,16 +1,35 @@
 """Tests for deduplication cache."""
 
-import time
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
+import blake3
+import pytest
+
+from src.utils import deduplication
 from src.utils.deduplication import DeduplicationCache
+from src.utils.serialization import encode_payload
+
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
 
 
 def test_cache_initialization():
     """Test cache initializes with correct window."""
     cache = DeduplicationCache(window_seconds=300)
     assert cache.window_seconds == 300
-    assert len(cache._cache) == 0
+    assert cache.max_size == 10_000
+    assert cache.hash_algo == "blake3"
+    assert len(cache._ids) == 0
 
 
 def test_fingerprint_generation():
@@ -25,7 +44,34 @@ def test_fingerprint_generation():
 
     # Same content, different order = same fingerprint
     assert fp1 == fp2
-    assert len(fp1) == 64  # SHA256 hex length
+    assert len(fp1) == deduplication.FINGERPRINT_BYTES
+
+
+def test_fingerprint_hash_algo_can_be_pinned():
+    """Test hash_algo selects the fingerprint hash."""
+    blake = DeduplicationCache(hash_algo="blake3")
+    sha = DeduplicationCache(hash_algo="sha256")
+
+    fp_blake = blake._generate_fingerprint("user.login", {"user_id": "123"})
+    fp_sha = sha._generate_fingerprint("user.login", {"user_id": "123"})
+
+    assert len(fp_sha) == deduplication.FINGERPRINT_BYTES
+    assert fp_blake != fp_sha
+
+    with pytest.raises(ValueError, match="hash_algo"):
+        DeduplicationCache(hash_algo="md5")
+
+
+def test_fingerprint_handles_payloads_orjson_rejects():
+    """Test payloads orjson cannot encode still fingerprint deterministically."""
+    cache = DeduplicationCache()
+
+    payload1 = {"big": 2**70, "a": 1}
+    payload2 = {"a": 1, "big": 2**70}
+
+    assert cache._generate_fingerprint("test.big", payload1) == (
+        cache._generate_fingerprint("test.big", payload2)
+    )
 
 
 def test_fingerprint_differs_for_different_events():
@@ -50,7 +96,7 @@ def test_check_and_add_new_event():
     )
 
     assert result is None
-    assert len(cache._cache) == 1
+    assert len(cache._ids) == 1
 
 
 def test_check_and_add_duplicate_event():
@@ -86,20 +132,21 @@ def test_duplicate_with_different_order():
 
 def test_cleanup_expired_entries():
     """Test expired entries are cleaned up."""
-    cache = DeduplicationCache(window_seconds=1)
+    clock = FakeClock()
+    cache = DeduplicationCache(window_seconds=1, time_fn=clock)
 
     # Add event
     cache.check_and_add("test.event", {"data": "test"}, "event-123")
-    assert len(cache._cache) == 1
+    assert len(cache._ids) == 1
 
-    # Wait for expiration
-    time.sleep(1.1)
+    # Move past expiration
+    clock.advance(1.1)
 
     # Trigger cleanup by checking new event
     cache.check_and_add("test.event2", {"data": "test2"}, "event-456")
 
     # Old entry should be removed
-    assert len(cache._cache) == 1
+    assert len(cache._ids) == 1
 
     # Original event should not be found (expired)
     result = cache.check_and_add("test.event", {"data": "test"}, "event-789")
@@ -112,10 +159,10 @@ def test_clear_cache():
 
     cache.check_and_add("event1", {"data": "1"}, "id-1")
     cache.check_and_add("event2", {"data": "2"}, "id-2")
-    assert len(cache._cache) == 2
+    assert len(cache._ids) == 2
 
     cache.clear()
-    assert len(cache._cache) == 0
+    assert len(cache._ids) == 0
 
 
 def test_multiple_different_events():
@@ -127,19 +174,18 @@ def test_multiple_different_events():
         result = cache.check_and_add(f"event.{i}", {"index": i}, f"event-{i}")
         assert result is None
 
-    assert len(cache._cache) == 5
+    assert len(cache._ids) == 5
 
 
 def test_expiry_time_calculation():
     """Test expiry time is set correctly."""
-    cache = DeduplicationCache(window_seconds=300)
+    cache = DeduplicationCache(window_seconds=300, time_fn=FakeClock(1000.0))
 
-    with patch("time.time", return_value=1000.0):
-        cache.check_and_add("test.event", {"data": "test"}, "event-123")
+    cache.check_and_add("test.event", {"data": "test"}, "event-123")
 
-        # Check expiry is set to now + window_seconds
-        for _, (_, expiry) in cache._cache.items():
-            assert expiry == 1300.0  # 1000 + 300
+    # Check expiry is set to now + window_seconds
+    for _, expiry in cache._expiries:
+        assert expiry == 1300.0  # 1000 + 300
 
 
 # Edge Case Tests for Timing
@@ -160,14 +206,15 @@ def test_duplicate_detected_within_window():
 
 def test_duplicate_not_detected_after_window_expires():
     """Test duplicate is NOT detected after window expires."""
-    cache = DeduplicationCache(window_seconds=2)
+    clock = FakeClock()
+    cache = DeduplicationCache(window_seconds=2, time_fn=clock)
 
     # Add first event
     result1 = cache.check_and_add("user.login", {"user_id": "123"}, "event-1")
     assert result1 is None
 
-    # Wait for window to expire
-    time.sleep(2.1)
+    # Move past the window
+    clock.advance(2.1)
 
     # Trigger cleanup and add "duplicate" (should be treated as new)
     result2 = cache.check_and_add("user.login", {"user_id": "123"}, "event-2")
@@ -180,14 +227,15 @@ def test_duplicate_not_detected_after_window_expires():
 
 def test_duplicate_at_window_boundary():
     """Test duplicate detection at edge of window boundary."""
-    cache = DeduplicationCache(window_seconds=1)
+    clock = FakeClock()
+    cache = DeduplicationCache(window_seconds=1, time_fn=clock)
 
     # Add first event
     result1 = cache.check_and_add("test.event", {"data": "test"}, "event-1")
     assert result1 is None
 
-    # Wait just under window time
-    time.sleep(0.9)
+    # Move to just under window time
+    clock.advance(0.9)
 
     # Should still detect duplicate
     result2 = cache.check_and_add("test.event", {"data": "test"}, "event-2")
@@ -196,25 +244,26 @@ def test_duplicate_at_window_boundary():
 
 def test_multiple_events_different_expiry_times():
     """Test multiple events with different expiry times are cleaned up correctly."""
-    cache = DeduplicationCache(window_seconds=2)
+    clock = FakeClock()
+    cache = DeduplicationCache(window_seconds=2, time_fn=clock)
 
     # Add first event
     cache.check_and_add("event.1", {"id": 1}, "id-1")
-    assert len(cache._cache) == 1
+    assert len(cache._ids) == 1
 
-    # Wait 1 second and add second event
-    time.sleep(1)
+    # Advance 1 second and add second event
+    clock.advance(1)
     cache.check_and_add("event.2", {"id": 2}, "id-2")
-    assert len(cache._cache) == 2
+    assert len(cache._ids) == 2
 
-    # Wait another 1.5 seconds (total 2.5) - first event should expire
-    time.sleep(1.5)
+    # Advance another 1.5 seconds (total 2.5) - first event should expire
+    clock.advance(1.5)
 
     # Trigger cleanup by adding new event
     cache.check_and_add("event.3", {"id": 3}, "id-3")
 
     # First event should be gone, but second and third should remain
-    assert len(cache._cache) == 2
+    assert len(cache._ids) == 2
 
     # First event should not be detected as duplicate
     result = cache.check_and_add("event.1", {"id": 1}, "id-4")
@@ -235,26 +284,67 @@ def test_concurrent_duplicates_within_window():
         assert result == "event-1"
 
     # Cache should only have one entry
-    assert len(cache._cache) == 1
+    assert len(cache._ids) == 1
+
+
+def test_resubmitted_event_id_is_reported_as_duplicate():
+    """Test replaying an event with its original ID is still a duplicate."""
+    cache = DeduplicationCache(window_seconds=300)
+    event_id = "event-1"
+
+    assert cache.check_and_add("order.placed", {"order_id": "1"}, event_id) is None
+    assert cache.check_and_add("order.placed", {"order_id": "1"}, event_id) == event_id
+    assert len(cache._ids) == len(cache._expiries) == 1
+
+
+def test_repeated_fingerprint_is_hashed_once():
+    """Test identical small events reuse the memoized fingerprint."""
+    deduplication._hash_event_cached.cache_clear()
+    hasher = Mock(wraps=blake3.blake3)
+    cache = DeduplicationCache(window_seconds=300)
+
+    with patch.dict(deduplication.HASH_ALGORITHMS, {"blake3": hasher}):
+        for i in range(8):
+            cache.check_and_add("order.placed", {"order_id": "memo"}, f"event-{i}")
+
+    assert hasher.call_count == 1
+
+
+def test_large_payload_fingerprint_is_not_memoized():
+    """Test payloads above the memo size limit are hashed every time."""
+    deduplication._hash_event_cached.cache_clear()
+    cache = DeduplicationCache()
+    payload = {"data": "x" * deduplication.FINGERPRINT_MEMO_MAX_BYTES}
+
+    fp1 = cache._generate_fingerprint("test.large", payload)
+    fp2 = cache._generate_fingerprint("test.large", payload)
+
+    assert fp1 == fp2
+    assert deduplication._hash_event_cached.cache_info().currsize == 0
 
 
 def test_zero_window_no_deduplication():
-    """Test that window_seconds=0 effectively disables deduplication."""
+    """Test that window_seconds=0 disables deduplication without hashing."""
     cache = DeduplicationCache(window_seconds=0)
 
-    # Add first event
-    result1 = cache.check_and_add("test.event", {"data": "test"}, "event-1")
-    assert result1 is None
+    with patch.object(cache, "_fingerprint_encoded") as mock_fingerprint:
+        result1 = cache.check_and_add("test.event", {"data": "test"}, "event-1")
+        result2 = cache.check_and_add("test.event", {"data": "test"}, "event-2")
+        results = cache.check_and_add_batch(
+            [("test.event", encode_payload({"data": "test"}))], ["event-3"]
+        )
 
-    # Immediate "duplicate" should not be detected (already expired)
-    cache.check_and_add("test.event", {"data": "test"}, "event-2")
-    # Note: This might still detect as duplicate if executed in same instant
-    # In practice, entries expire immediately, so this tests cleanup behavior
+    assert result1 is None
+    assert result2 is None
+    assert results == [None]
+    mock_fingerprint.assert_not_called()
+    assert len(cache._ids) == 0
 
 
 def test_very_short_window():
     """Test deduplication with very short window (0.1 seconds)."""
-    cache = DeduplicationCache(window_seconds=0.1)
+    clock = FakeClock()
+    cache = DeduplicationCache(window_seconds=0.1, time_fn=clock)
 
     # Add event
     result1 = cache.check_and_add("test.event", {"data": "test"}, "event-1")
@@ -264,8 +354,8 @@ def test_very_short_window():
     result2 = cache.check_and_add("test.event", {"data": "test"}, "event-2")
     assert result2 == "event-1"
 
-    # Wait for window to expire
-    time.sleep(0.15)
+    # Move past the window
+    clock.advance(0.15)
 
     # Should not detect duplicate anymore
     result3 = cache.check_and_add("test.event", {"data": "test"}, "event-3")
@@ -280,13 +370,13 @@ def test_cleanup_does_not_affect_valid_entries():
     for i in range(5):
         cache.check_and_add(f"event.{i}", {"index": i}, f"id-{i}")
 
-    assert len(cache._cache) == 5
+    assert len(cache._ids) == 5
 
     # Trigger cleanup (no entries should expire yet)
-    cache._cleanup_expired()
+    cache._cleanup_expired(cache._now())
 
     # All entries should still be present
-    assert len(cache._cache) == 5
+    assert len(cache._ids) == 5
 
 
 def test_large_number_of_entries():
@@ -298,9 +388,135 @@ def test_large_number_of_entries():
         result = cache.check_and_add(f"event.{i}", {"index": i}, f"id-{i}")
         assert result is None
 
-    assert len(cache._cache) == 1000
+    assert len(cache._ids) == 1000
 
     # All events should still be detectable as duplicates
     for i in range(100):  # Test subset
         result = cache.check_and_add(f"event.{i}", {"index": i}, f"new-id-{i}")
         assert result == f"id-{i}"
+
+
+def test_max_size_evicts_oldest_entry():
+    """Test cache stays bounded and evicts the oldest entry first."""
+    cache = DeduplicationCache(window_seconds=300, max_size=2)
+
+    cache.check_and_add("event.a", {"id": "a"}, "id-a")
+    cache.check_and_add("event.b", {"id": "b"}, "id-b")
+
+    # A hit does not extend an entry's lifetime or queue position
+    assert cache.check_and_add("event.a", {"id": "a"}, "id-a2") == "id-a"
+
+    cache.check_and_add("event.c", {"id": "c"}, "id-c")
+    assert len(cache._ids) == len(cache._expiries) == 2
+
+    # "a" was evicted, "b" survived
+    assert cache.check_and_add("event.b", {"id": "b"}, "id-b2") == "id-b"
+    assert cache.check_and_add("event.a", {"id": "a"}, "id-a3") is None
+
+
+def test_admission_filter_protects_full_cache():
+    """Test a full cache only admits fingerprints seen more than once."""
+    cache = DeduplicationCache(window_seconds=300, max_size=2, admission_filter=True)
+    cache.check_and_add("event.a", {"id": "a"}, "id-a")
+    cache.check_and_add("event.b", {"id": "b"}, "id-b")
+
+    # First sighting of "c" is rejected; "a" and "b" survive
+    assert cache.check_and_add("event.c", {"id": "c"}, "id-c") is None
+    assert len(cache._ids) == len(cache._expiries) == 2
+    assert cache.check_and_add("event.a", {"id": "a"}, "id-a2") == "id-a"
+
+    # Second sighting is admitted and evicts the oldest entry
+    assert cache.check_and_add("event.c", {"id": "c"}, "id-c2") is None
+    assert cache.check_and_add("event.c", {"id": "c"}, "id-c3") == "id-c2"
+    assert cache.check_and_add("event.a", {"id": "a"}, "id-a3") is None
+
+
+def test_admission_filter_does_not_gate_until_full():
+    """Test new events are admitted on first sight while there is room."""
+    cache = DeduplicationCache(window_seconds=300, admission_filter=True)
+
+    assert cache.check_and_add("user.signup", {"id": "1"}, "event-1") is None
+    assert cache.check_and_add("user.signup", {"id": "1"}, "event-2") == "event-1"
+
+
+def test_check_and_add_encoded_matches_check_and_add():
+    """Test pre-encoded payloads share fingerprints with dict payloads."""
+    cache = DeduplicationCache()
+
+    cache.check_and_add("user.signup", {"b": 2, "a": 1}, "event-1")
+
+    result = cache.check_and_add_encoded(
+        "user.signup", encode_payload({"a": 1, "b": 2}), "event-2"
+    )
+    assert result == "event-1"
+
+
+def test_check_and_add_batch_collapses_duplicates():
+    """Test batch check resolves in-batch and cached duplicates in order."""
+    cache = DeduplicationCache()
+    cache.check_and_add("user.login", {"user_id": "1"}, "cached-id")
+
+    events = [
+        ("user.login", encode_payload({"user_id": "1"})),
+        ("user.login", encode_payload({"user_id": "2"})),
+        ("user.login", encode_payload({"user_id": "2"})),
+    ]
+    results = cache.check_and_add_batch(events, ["id-a", "id-b", "id-c"])
+
+    assert results == ["cached-id", None, "id-b"]
+    assert len(cache._ids) == 2
+
+
+def test_check_and_add_many_duplicate_event():
+    """Test batched check detects duplicates like check_and_add."""
+    cache = DeduplicationCache(window_seconds=300)
+    payload = {"user_id": "123", "action": "login"}
+
+    results = cache.check_and_add_many(
+        [
+            ("user.login", payload, "event-1"),
+            ("user.login", {"action": "login", "user_id": "123"}, "event-2"),
+            ("user.logout", payload, "event-3"),
+        ]
+    )
+
+    assert results == [None, "event-1", None]
+    assert cache.check_and_add("user.login", payload, "event-4") == "event-1"
+
+
+def test_discard_batch_forgets_only_matching_entries():
+    """Test discarded events are no longer duplicates; others are kept."""
+    cache = DeduplicationCache()
+    cache.check_and_add("user.login", {"user_id": "1"}, "cached-id")
+    events = [
+        ("user.login", encode_payload({"user_id": "1"})),
+        ("user.login", encode_payload({"user_id": "2"})),
+    ]
+    cache.check_and_add_batch(events, ["id-a", "id-b"])
+
+    # "id-a" was a duplicate of "cached-id", so that entry must survive
+    cache.discard_batch(events, ["id-a", "id-b"])
+
+    assert len(cache._ids) == len(cache._expiries) == 1
+    assert cache.check_and_add("user.login", {"user_id": "1"}, "x") == "cached-id"
+    assert cache.check_and_add("user.login", {"user_id": "2"}, "id-c") is None
+
+
+def test_count_min_sketch_halves_counters_after_sample():
+    """Test sketch counters age out once the sample size is reached."""
+    sketch = deduplication._CountMinSketch(width=2, depth=1)  # sample size 20
+    fingerprint = bytes(deduplication.FINGERPRINT_BYTES)
+
+    estimates = [sketch.increment(fingerprint) for _ in range(20)]
+
+    assert estimates[-1] == 20
+    assert sketch._rows[0][0] == 10
+    assert sketch.increment(fingerprint) == 11
+
+
+def test_count_min_sketch_rejects_depth_beyond_fingerprint():
+    """Test the sketch refuses rows the fingerprint cannot index."""
+    depth = deduplication.FINGERPRINT_BYTES // 4 + 1
+
+    with pytest.raises(ValueError, match="fingerprint bytes"):
+        deduplication._CountMinSketch(depth=depth)
@@ -1,8 +1,8 @@
 """Tests for pagination utilities and cursor handling."""
 
-import json
+import base64
 
-import pytest
+from src.utils.cursor import decode_cursor, encode_cursor
 
 
 def test_cursor_encoding_decoding():
@@ -10,16 +10,34 @@ def test_cursor_encoding_decoding():
     cursor_data = {"event_id": "test-123", "timestamp": "2025-11-11T12:00:00Z"}
 
     # Encode
-    cursor = json.dumps(cursor_data)
+    cursor = encode_cursor(cursor_data)
 
     # Decode
-    decoded = json.loads(cursor)
+    decoded = decode_cursor(cursor)
 
     assert decoded == cursor_data
     assert decoded["event_id"] == "test-123"
     assert decoded["timestamp"] == "2025-11-11T12:00:00Z"
 
 
+def test_cursor_is_url_safe():
+    """Test cursor contains only unpadded URL-safe base64 characters."""
+    cursor = encode_cursor({"event_id": "???>>>", "timestamp": "2025-11-11T12:00:00Z"})
+
+    assert "+" not in cursor
+    assert "/" not in cursor
+    assert "=" not in cursor
+
+
+def test_padded_cursor_is_accepted():
+    """Test cursors issued with base64 padding still decode."""
+    key = {"event_id": "test", "timestamp": "2025-11-11T1"}
+    padded = base64.urlsafe_b64encode(b"test\x002025-11-11T1").decode("ascii")
+
+    assert padded.endswith("=")
+    assert decode_cursor(padded) == key
+
+
 def test_cursor_with_special_characters():
     """Test cursor with special characters in event_id."""
     cursor_data = {
@@ -27,23 +45,17 @@ def test_cursor_with_special_characters():
         "timestamp": "2025-11-11T12:00:00Z",
     }
 
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
-
-    assert decoded == cursor_data
+    assert decode_cursor(encode_cursor(cursor_data)) == cursor_data
 
 
 def test_cursor_with_unicode_characters():
     """Test cursor with unicode characters."""
     cursor_data = {
-        "event_id": "test-unicode-\u00e9\u00e8\u00ea\u4e2d\u6587",
+        "event_id": "test-unicode-éèê中文",
         "timestamp": "2025-11-11T12:00:00Z",
     }
 
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
-
-    assert decoded == cursor_data
+    assert decode_cursor(encode_cursor(cursor_data)) == cursor_data
 
 
 def test_cursor_with_very_long_event_id():
@@ -51,8 +63,7 @@ def test_cursor_with_very_long_event_id():
     long_id = "a" * 500  # Very long ID
     cursor_data = {"event_id": long_id, "timestamp": "2025-11-11T12:00:00Z"}
 
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
+    decoded = decode_cursor(encode_cursor(cursor_data))
 
     assert decoded == cursor_data
     assert len(decoded["event_id"]) == 500
@@ -60,100 +71,59 @@ def test_cursor_with_very_long_event_id():
 
 def test_invalid_cursor_empty_string():
     """Test handling of empty cursor string."""
-    cursor = ""
-
-    with pytest.raises(json.JSONDecodeError):
-        json.loads(cursor)
+    assert decode_cursor("") is None
 
 
-def test_invalid_cursor_not_json():
-    """Test handling of non-JSON cursor."""
-    cursor = "not-valid-json"
+def test_invalid_cursor_not_base64():
+    """Test handling of cursor with characters outside the base64 alphabet."""
+    assert decode_cursor("not valid base64!") is None
 
-    with pytest.raises(json.JSONDecodeError):
-        json.loads(cursor)
 
+def test_invalid_cursor_bad_length():
+    """Test handling of a cursor with an impossible base64 length."""
+    cursor = encode_cursor({"event_id": "test", "timestamp": "2025-11-11T12"})
 
-def test_invalid_cursor_incomplete_json():
-    """Test handling of incomplete JSON cursor."""
-    cursor = '{"event_id": "test"'  # Missing closing brace
+    assert len(cursor) % 4 == 0
+    assert decode_cursor(cursor + "A") is None
 
-    with pytest.raises(json.JSONDecodeError):
-        json.loads(cursor)
 
+def test_invalid_cursor_legacy_json():
+    """Test JSON cursors from the previous format are rejected."""
+    assert decode_cursor('{"event_id": "test"}') is None
 
-def test_invalid_cursor_null():
-    """Test handling of null as cursor."""
-    cursor = "null"
 
-    # This is valid JSON but not a valid cursor object
-    decoded = json.loads(cursor)
-    assert decoded is None
+def test_invalid_cursor_not_utf8():
+    """Test handling of cursor that decodes to invalid UTF-8."""
+    cursor = base64.urlsafe_b64encode(b"\xff\xfe\x00\xff").decode("ascii")
 
+    assert decode_cursor(cursor) is None
 
-def test_invalid_cursor_array():
-    """Test handling of array as cursor instead of object."""
-    cursor = '["event_id", "timestamp"]'
 
-    decoded = json.loads(cursor)
-    assert isinstance(decoded, list)
-    # Caller should validate it's a dict
+def test_cursor_missing_separator():
+    """Test cursor without the key separator is rejected."""
+    cursor = base64.urlsafe_b64encode(b"test-123").decode("ascii")
 
+    assert decode_cursor(cursor) is None
 
-def test_cursor_missing_required_fields():
-    """Test cursor with missing required fields."""
-    # Missing timestamp
-    cursor_data = {"event_id": "test-123"}
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
 
-    # Decoding succeeds, but missing fields should be caught by caller
-    assert "timestamp" not in decoded
+def test_cursor_missing_timestamp():
+    """Test cursor with an empty timestamp is rejected."""
+    cursor = base64.urlsafe_b64encode(b"test-123\x00").decode("ascii")
 
+    assert decode_cursor(cursor) is None
 
-def test_cursor_with_extra_fields():
-    """Test cursor with extra fields is handled gracefully."""
-    cursor_data = {
-        "event_id": "test-123",
-        "timestamp": "2025-11-11T12:00:00Z",
-        "extra_field": "should_be_ignored",
-        "another_field": 42,
-    }
-
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
 
-    assert decoded == cursor_data
-    assert decoded["event_id"] == "test-123"
-
-
-def test_cursor_with_numeric_values():
-    """Test cursor containing numeric values."""
-    cursor_data = {
+def test_cursor_ignores_extra_key_fields():
+    """Test extra LastEvaluatedKey attributes are not carried in the cursor."""
+    key = {
         "event_id": "test-123",
         "timestamp": "2025-11-11T12:00:00Z",
-        "count": 100,
+        "delivered": 0,
     }
 
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
+    decoded = decode_cursor(encode_cursor(key))
 
-    assert decoded == cursor_data
-    assert decoded["count"] == 100
-
-
-def test_cursor_with_nested_objects():
-    """Test cursor with nested objects (edge case)."""
-    cursor_data = {
-        "event_id": "test-123",
-        "timestamp": "2025-11-11T12:00:00Z",
-        "metadata": {"nested": {"deeply": "nested"}},
-    }
-
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
-
-    assert decoded == cursor_data
+    assert decoded == {"event_id": "test-123", "timestamp": "2025-11-11T12:00:00Z"}
 
 
 def test_cursor_roundtrip_preserves_data():
@@ -163,8 +133,7 @@ def test_cursor_roundtrip_preserves_data():
     # Multiple roundtrips
     data = original_data
     for _ in range(5):
-        cursor = json.dumps(data)
-        data = json.loads(cursor)
+        data = decode_cursor(encode_cursor(data))
 
     assert data == original_data
 
@@ -173,8 +142,7 @@ def test_cursor_with_empty_event_id():
     """Test cursor with empty event_id string."""
     cursor_data = {"event_id": "", "timestamp": "2025-11-11T12:00:00Z"}
 
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
+    decoded = decode_cursor(encode_cursor(cursor_data))
 
     assert decoded == cursor_data
     assert decoded["event_id"] == ""
@@ -184,48 +152,24 @@ def test_cursor_with_whitespace_only_event_id():
     """Test cursor with whitespace-only event_id."""
     cursor_data = {"event_id": "   ", "timestamp": "2025-11-11T12:00:00Z"}
 
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
-
-    assert decoded == cursor_data
+    assert decode_cursor(encode_cursor(cursor_data)) == cursor_data
 
 
 def test_cursor_encoding_is_deterministic():
     """Test that cursor encoding is deterministic for same data."""
     cursor_data = {"event_id": "test-123", "timestamp": "2025-11-11T12:00:00Z"}
 
-    cursor1 = json.dumps(cursor_data, sort_keys=True)
-    cursor2 = json.dumps(cursor_data, sort_keys=True)
+    cursor1 = encode_cursor(cursor_data)
+    cursor2 = encode_cursor(dict(reversed(cursor_data.items())))
 
     assert cursor1 == cursor2
 
 
-def test_cursor_field_order_independence():
-    """Test cursor works regardless of field order in JSON."""
-    cursor1 = '{"event_id": "test", "timestamp": "2025-11-11T12:00:00Z"}'
-    cursor2 = '{"timestamp": "2025-11-11T12:00:00Z", "event_id": "test"}'
+def test_repeated_decode_returns_independent_dicts():
+    """Test cached decodes never share a mutable key between callers."""
+    cursor = encode_cursor({"event_id": "test-789", "timestamp": "2025-11-11"})
 
-    decoded1 = json.loads(cursor1)
-    decoded2 = json.loads(cursor2)
+    first = decode_cursor(cursor)
+    first["delivered"] = 0
 
-    # Content should be same regardless of order
-    assert decoded1 == decoded2
-
-
-def test_large_cursor_object():
-    """Test handling of very large cursor object."""
-    # Create large cursor with many fields
-    cursor_data = {
-        "event_id": "test-123",
-        "timestamp": "2025-11-11T12:00:00Z",
-    }
-
-    # Add many extra fields
-    for i in range(100):
-        cursor_data[f"field_{i}"] = f"value_{i}"
-
-    cursor = json.dumps(cursor_data)
-    decoded = json.loads(cursor)
-
-    assert decoded == cursor_data
-    assert len(decoded) == 102  # 2 required + 100 extra
+    assert decode_cursor(cursor) == {"event_id": "test-789", "timestamp": "2025-11-11"}